@@ -4,13 +4,12 @@ A comprehensive multi-system horoscope application with beautiful UI
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Tuple
+import os
 
 # Import our core modules
-from core import AstrologicalCalculator, PredictionGenerator
+from core import AstrologicalCalculator, PredictionGenerator, get_cached_prediction
 from utils.language import UI_TEXTS, LANGUAGES, get_text
 
 
@@ -188,11 +187,157 @@ def get_zodiac_icon(sign: str) -> str:
     return icons.get(sign, "✨")
 
 
+@st.cache_data(max_entries=4096, show_spinner=False)
+def profile_cards_html(lang: str, birth_date: date) -> Tuple[str, ...]:
+    """Western, Chinese, moon and Vedic sign cards for a birth date
+    
+    The cards only show date-invariant signs, so their markup is memoized per
+    (lang, birth_date) and shared by every session and rerun. st.cache_data is
+    used rather than lru_cache because Streamlit re-executes this module on
+    every rerun.
+    """
+    texts = UI_TEXTS[lang]
+    data = AstrologicalCalculator.calculate_static_profile(datetime.combine(birth_date, datetime.min.time()))
+    wz = data['western_zodiac']
+    cz = data['chinese_zodiac']
+    ms = data['moon_sign']
+    vs = data['vedic_zodiac']
+    return (
+        f"""
+            <div class="metric-card">
+                <div class="zodiac-icon">{get_zodiac_icon(wz['sign_en'])}</div>
+                <div style="font-size: 14px;">{texts['western_zodiac']}</div>
+                <div style="font-size: 18px; font-weight: bold;">{wz['sign_th']}</div>
+            </div>
+            """,
+        f"""
+            <div class="metric-card">
+                <div class="zodiac-icon">{get_zodiac_icon(cz['animal_en'])}</div>
+                <div style="font-size: 14px;">{texts['chinese_zodiac']}</div>
+                <div style="font-size: 18px; font-weight: bold;">{cz['animal_th']}</div>
+                <div style="font-size: 12px; opacity: 0.8;">{cz['element_th']}</div>
+            </div>
+            """,
+        f"""
+            <div class="metric-card">
+                <div class="zodiac-icon">🌙</div>
+                <div style="font-size: 14px;">{texts['moon_sign']}</div>
+                <div style="font-size: 18px; font-weight: bold;">{ms['sign_th']}</div>
+            </div>
+            """,
+        f"""
+            <div class="metric-card">
+                <div class="zodiac-icon">🕉️</div>
+                <div style="font-size: 14px;">{texts['vedic_zodiac']}</div>
+                <div style="font-size: 18px; font-weight: bold;">{vs['sign_th']}</div>
+            </div>
+            """,
+    )
+
+
+# ============== Fragments ==============
+# A widget inside a fragment reruns only that fragment, so switching the period
+# redraws the prediction cards without resending the CSS, hero and profile.
+@st.fragment
+def prediction_panel(data: Dict[str, Any], birth_date: date, lang: str):
+    """Period selector and prediction cards"""
+    texts = UI_TEXTS[lang]
+    
+    st.subheader(f"📿 {texts['predictions']}")
+    
+    # Period selector
+    period_cols = st.columns(3)
+    with period_cols[0]:
+        period = st.radio(
+            texts['select_period'],
+            options=['daily', 'weekly', 'monthly'],
+            format_func=lambda x: {
+                'daily': f"📅 {texts['daily']}",
+                'weekly': f"📆 {texts['weekly']}",
+                'monthly': f"🗓️ {texts['monthly']}",
+            }[x],
+            horizontal=True
+        )
+    
+    # Generate prediction
+    # Served from the process-wide cache, so popular birth dates are shared across
+    # sessions and a period or language switch is a dictionary lookup
+    st.session_state.prediction = get_cached_prediction(
+        data,
+        datetime.combine(birth_date, datetime.min.time()),
+        period,
+        lang,
+    )
+    
+    prediction = st.session_state.prediction
+    
+    # Overview
+    if 'overview' in prediction:
+        st.markdown(f"""
+        <div class="card" style="text-align: center; font-size: 18px;">
+            {prediction['overview']}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Category predictions
+    categories = [
+        ('financial', texts['financial'], '💰'),
+        ('career', texts['career'], '💼'),
+        ('love', texts['love'], '❤️'),
+        ('health', texts['health'], '🏥'),
+        ('family', texts['family'], '👨‍👩‍👧'),
+        ('education', texts['education'], '📚'),
+    ]
+    
+    for cat_key, cat_name, cat_icon in categories:
+        if cat_key in prediction['predictions']:
+            st.markdown(f"""
+            <div class="prediction-card prediction-{cat_key}">
+                <h4 style="margin: 0 0 12px 0;">{cat_icon} {cat_name}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            for pred in prediction['predictions'][cat_key]:
+                st.markdown(f"• {pred}")
+            
+            st.markdown("")
+
+
+@st.fragment
+def lucky_section(data: Dict[str, Any], lang: str):
+    """Lucky numbers, colors and days"""
+    texts = UI_TEXTS[lang]
+    
+    st.markdown("---")
+    st.subheader(f"{texts['lucky']}")
+    
+    predictor = PredictionGenerator.for_language(lang)
+    lucky = predictor.get_lucky_elements(data)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("🎯 **Numbers**")
+        st.write(", ".join(lucky['numbers']))
+    
+    with col2:
+        st.markdown("🎨 **Colors**")
+        st.write(", ".join(lucky['colors']))
+    
+    with col3:
+        st.markdown("📅 **Lucky Days**")
+        st.write(", ".join(lucky['days']))
+
+
 # ============== Main Application ==============
 def main():
     """Main application function"""
     load_custom_css()
     
+    # Share the prebuilt profile index and prediction store across sessions when they have been built
+    AstrologicalCalculator.load_profile_index()
+    PredictionGenerator.load_prediction_store()
+    
     # Session state
     if 'language' not in st.session_state:
         st.session_state.language = 'th'
@@ -270,47 +415,9 @@ def main():
         st.info(f"📆 {birth_display} | 🗓️ {age} {texts['life_path'].lower()}")
         
         # Create metrics grid
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="zodiac-icon">{get_zodiac_icon(data['western_zodiac']['sign_en'])}</div>
-                <div style="font-size: 14px;">{texts['western_zodiac']}</div>
-                <div style="font-size: 18px; font-weight: bold;">{data['western_zodiac']['sign_th']}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            cz = data['chinese_zodiac']
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="zodiac-icon">{get_zodiac_icon(cz['animal_en'])}</div>
-                <div style="font-size: 14px;">{texts['chinese_zodiac']}</div>
-                <div style="font-size: 18px; font-weight: bold;">{cz['animal_th']}</div>
-                <div style="font-size: 12px; opacity: 0.8;">{cz['element_th']}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            ms = data['moon_sign']
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="zodiac-icon">🌙</div>
-                <div style="font-size: 14px;">{texts['moon_sign']}</div>
-                <div style="font-size: 18px; font-weight: bold;">{ms['sign_th']}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            vs = data['vedic_zodiac']
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="zodiac-icon">🕉️</div>
-                <div style="font-size: 14px;">{texts['vedic_zodiac']}</div>
-                <div style="font-size: 18px; font-weight: bold;">{vs['sign_th']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        for col, card in zip(st.columns(4), profile_cards_html(st.session_state.language, birth_date)):
+            with col:
+                st.markdown(card, unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -355,93 +462,8 @@ def main():
         
         st.markdown("---")
         
-        # ============== Predictions Section ==============
-        st.subheader(f"📿 {texts['predictions']}")
-        
-        # Period selector
-        period_cols = st.columns(3)
-        with period_cols[0]:
-            period = st.radio(
-                texts['select_period'],
-                options=['daily', 'weekly', 'monthly'],
-                format_func=lambda x: {
-                    'daily': f"📅 {texts['daily']}",
-                    'weekly': f"📆 {texts['weekly']}",
-                    'monthly': f"🗓️ {texts['monthly']}",
-                }[x],
-                horizontal=True
-            )
-        
-        # Generate prediction
-        if st.session_state.prediction is None or st.session_state.prediction.get('period') != period:
-            predictor = PredictionGenerator(st.session_state.language)
-            
-            if period == 'daily':
-                st.session_state.prediction = predictor.generate_daily_prediction(
-                    data, datetime.combine(birth_date, datetime.min.time())
-                )
-            elif period == 'weekly':
-                st.session_state.prediction = predictor.generate_weekly_forecast(
-                    data, datetime.combine(birth_date, datetime.min.time())
-                )
-            else:
-                st.session_state.prediction = predictor.generate_monthly_outlook(
-                    data, datetime.combine(birth_date, datetime.min.time())
-                )
-        
-        prediction = st.session_state.prediction
-        
-        # Overview
-        if 'overview' in prediction:
-            st.markdown(f"""
-            <div class="card" style="text-align: center; font-size: 18px;">
-                {prediction['overview']}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Category predictions
-        categories = [
-            ('financial', texts['financial'], '💰'),
-            ('career', texts['career'], '💼'),
-            ('love', texts['love'], '❤️'),
-            ('health', texts['health'], '🏥'),
-            ('family', texts['family'], '👨‍👩‍👧'),
-            ('education', texts['education'], '📚'),
-        ]
-        
-        for cat_key, cat_name, cat_icon in categories:
-            if cat_key in prediction['predictions']:
-                st.markdown(f"""
-                <div class="prediction-card prediction-{cat_key}">
-                    <h4 style="margin: 0 0 12px 0;">{cat_icon} {cat_name}</h4>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                for pred in prediction['predictions'][cat_key]:
-                    st.markdown(f"• {pred}")
-                
-                st.markdown("")
-        
-        # ============== Lucky Elements ==============
-        st.markdown("---")
-        st.subheader(f"{texts['lucky']}")
-        
-        predictor = PredictionGenerator(st.session_state.language)
-        lucky = predictor.get_lucky_elements(data)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("🎯 **Numbers**")
-            st.write(", ".join(lucky['numbers']))
-        
-        with col2:
-            st.markdown("🎨 **Colors**")
-            st.write(", ".join(lucky['colors']))
-        
-        with col3:
-            st.markdown("📅 **Lucky Days**")
-            st.write(", ".join(lucky['days']))
+        prediction_panel(data, birth_date, st.session_state.language)
+        lucky_section(data, st.session_state.language)
         
         # ============== Disclaimer ==============
         st.markdown("---")
@@ -453,4 +475,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Only pay for importing core.metrics when instrumentation is switched on
+    if os.environ.get("HOROSCOPE_METRICS") == "1":
+        from core import metrics
+
+        with metrics.timed("app.main"):
+            main()
+    else:
+        main()
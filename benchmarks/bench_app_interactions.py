@@ -0,0 +1,161 @@
+"""
+App Interaction Benchmark
+Measures server time and websocket payload per interaction against a real,
+headless ``streamlit run app.py``, the way a browser session sees them
+
+Run from the repository root:
+    python -m benchmarks.bench_app_interactions
+    python -m benchmarks.bench_app_interactions --app app.py --rounds 20
+
+The client behaves like the browser: it reports the hashes of cacheable
+messages it has already received, so repeated large elements are not resent.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DONE = (
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+
+
+class Session:
+    """One websocket session that tracks widgets and the client message cache"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets: Dict[str, Tuple[object, Optional[str]]] = {}
+        self.cached_hashes = set()
+        self.page_script_hash = ""
+
+    async def run(
+        self,
+        states: List[WidgetState] = (),
+        fragment_id: str = "",
+    ) -> Tuple[float, int, int]:
+        """Send one rerun and wait for it to finish: (seconds, bytes, messages)"""
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.page_script_hash = self.page_script_hash
+        client_state.fragment_id = fragment_id
+        client_state.widget_states.widgets.extend(states)
+        client_state.cached_message_hashes.extend(self.cached_hashes)
+
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = count = 0
+        while True:
+            data = await self.ws.recv()
+            received += len(data)
+            count += 1
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            if forward.metadata.cacheable:
+                self.cached_hashes.add(forward.hash)
+            kind = forward.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = forward.new_session.page_script_hash
+            elif kind == "delta" and forward.delta.HasField("new_element"):
+                element = forward.delta.new_element
+                widget = getattr(element, element.WhichOneof("type"))
+                if getattr(widget, "id", ""):
+                    self.widgets[widget.DESCRIPTOR.name] = (widget, forward.delta.fragment_id or None)
+            elif kind == "script_finished":
+                if forward.script_finished in DONE:
+                    return time.perf_counter() - started, received, count
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app: str, port: int) -> subprocess.Popen:
+    """Launch streamlit headless and wait for its health endpoint"""
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", app,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=REPO_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit did not start")
+
+
+async def measure(port: int, rounds: int) -> Dict[str, List[Tuple[float, int, int]]]:
+    """Open a session, submit a birth date, then alternate the period radio"""
+    async with websockets.connect(
+        f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None
+    ) as ws:
+        session = Session(ws)
+        await session.run()
+
+        button, _ = session.widgets["Button"]
+        click = WidgetState(id=button.id, trigger_value=True)
+        await session.run([click])
+
+        results = {"period_switch": [], "full_rerun": []}
+        radio, fragment_id = session.widgets["Radio"]
+        for n in range(rounds):
+            choice = WidgetState(id=radio.id, string_value=radio.options[(n + 1) % len(radio.options)])
+            results["period_switch"].append(await session.run([choice], fragment_id or ""))
+            results["full_rerun"].append(await session.run([choice]))
+        return results
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Measure per-interaction cost of the Streamlit app")
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    server = start_server(args.app, port)
+    try:
+        results = asyncio.run(measure(port, args.rounds))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'interaction':<16}{'server ms (median)':>20}{'payload bytes':>16}{'messages':>10}")
+    for name, samples in results.items():
+        seconds, received, count = zip(*samples)
+        print(
+            f"{name:<16}{statistics.median(seconds) * 1000:>20.2f}"
+            f"{statistics.median(received):>16,.0f}{statistics.median(count):>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
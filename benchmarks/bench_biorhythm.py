@@ -0,0 +1,56 @@
+"""
+Biorhythm Range Benchmark
+Compares per-point trigonometry against the phase-table range API
+
+Run from the repository root:
+    python -m benchmarks.bench_biorhythm
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+import math
+import time
+
+import numpy as np
+
+from core.calculators import AstrologicalCalculator
+
+
+def scalar_range(birth_date: datetime, start: datetime, days: int) -> Dict[str, List[float]]:
+    """One sin() per cycle per day, as the scalar get_biorhythm used to compute it"""
+    curves = {"physical": [], "emotional": [], "intellectual": []}
+    for offset in range(days):
+        lived = (start + timedelta(days=offset) - birth_date).days
+        curves["physical"].append(round(50 + 50 * math.sin(2 * math.pi * lived / 23), 1))
+        curves["emotional"].append(round(50 + 50 * math.sin(2 * math.pi * lived / 28), 1))
+        curves["intellectual"].append(round(50 + 50 * math.sin(2 * math.pi * lived / 33), 1))
+    return curves
+
+
+def main(users: int = 2000, windows=(30, 90, 365)) -> None:
+    """Print points per second for scalar vs table-driven curves"""
+    rng = np.random.default_rng(0)
+    birth_dates = np.datetime64("1900-01-01") + rng.integers(0, 45000, users)
+    birth_list = [datetime.fromisoformat(str(d)) for d in birth_dates]
+    start = datetime(2026, 1, 1)
+
+    print(f"{'window':<8}{'scalar pts/s':>16}{'batch pts/s':>16}{'speedup':>10}")
+    for days in windows:
+        sample = birth_list[:100]
+        began = time.perf_counter()
+        expected = [scalar_range(b, start, days) for b in sample]
+        scalar_rate = len(sample) * days / (time.perf_counter() - began)
+
+        began = time.perf_counter()
+        result = AstrologicalCalculator.get_biorhythm_range_batch(birth_dates, start, days)
+        batch_rate = users * days / (time.perf_counter() - began)
+
+        for row, curves in enumerate(expected):
+            for name, values in curves.items():
+                assert list(result[name][row]) == values, (name, row)
+
+        print(f"{days:<8}{scalar_rate:>16,.0f}{batch_rate:>16,.0f}{batch_rate / scalar_rate:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
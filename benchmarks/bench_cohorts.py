@@ -0,0 +1,64 @@
+"""
+Cohort Deduplication Benchmark
+Compares per-user computation with compute_cohorts on a synthetic user base
+
+Run from the repository root:
+    python -m benchmarks.bench_cohorts
+    python -m benchmarks.bench_cohorts --users 5000000
+"""
+
+from datetime import datetime
+import argparse
+import time
+
+import numpy as np
+
+from core import AstrologicalCalculator, PredictionGenerator, compute_cohorts
+from core.predictors import PREDICTION_PERIODS
+
+
+AS_OF = datetime(2026, 1, 1)
+
+
+def per_user_seconds(dates: np.ndarray, sample: int) -> float:
+    """Mean time to profile and predict one user with the per-user API"""
+    generator = PredictionGenerator.for_language("en")
+    picked = [datetime.combine(d.item(), datetime.min.time()) for d in dates[:sample]]
+    began = time.perf_counter()
+    for birth_date in picked:
+        data = AstrologicalCalculator.calculate_all(birth_date, AS_OF)
+        for period in PREDICTION_PERIODS:
+            generator.generate_prediction_codes(data, birth_date, period)
+    return (time.perf_counter() - began) / len(picked)
+
+
+def main(argv=None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Measure birth-date cohort deduplication")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=500, help="users timed on the per-user path")
+    args = parser.parse_args(argv)
+
+    # Birth years 1940-2010, the range of a typical subscriber base
+    rng = np.random.default_rng(0)
+    dates = np.datetime64("1940-01-01") + rng.integers(0, 25567, args.users)
+    # The per-user calculate_all path does not support master-number life paths
+    candidates = dates[:10 * args.sample]
+    ordinary = candidates[AstrologicalCalculator.calculate_batch(candidates, AS_OF)["life_path"] < 10]
+
+    began = time.perf_counter()
+    cohorts = compute_cohorts(dates, as_of=AS_OF)
+    cohort_seconds = time.perf_counter() - began
+    per_user = per_user_seconds(ordinary, args.sample) * args.users
+
+    report = cohorts.report
+    print(f"users                 {report['users']:>14,}")
+    print(f"distinct birth dates  {report['distinct_birth_dates']:>14,}")
+    print(f"dedupe ratio          {report['dedupe_ratio']:>14,.1f}x")
+    print(f"cohort run            {cohort_seconds:>14.2f} s  ({report['unique_bytes'] / 1e6:.1f} MB held)")
+    print(f"per-user (estimated)  {per_user:>14.2f} s")
+    print(f"time saved            {per_user - cohort_seconds:>14.2f} s")
+
+
+if __name__ == "__main__":
+    main()
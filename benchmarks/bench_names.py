@@ -0,0 +1,87 @@
+"""
+Name Numerology Benchmark
+Compares a per-character dictionary scorer with core.numerology's translation
+tables, one name at a time and in batches
+
+Run from the repository root:
+    python -m benchmarks.bench_names
+    python -m benchmarks.bench_names --names 1000000
+"""
+
+from typing import Dict, List
+import argparse
+import random
+import re
+import time
+
+from core import numerology
+from core.numerology import PYTHAGOREAN_VALUES, THAI_TRANSLITERATION, VOWELS
+
+
+LATIN_PARTS = ["John", "Maria", "Chen", "Wei", "Müller", "José", "Anna", "Smith", "Nguyen", "O'Brien"]
+THAI_PARTS = ["สมชาย", "ใจดี", "สมศักดิ์", "รักไทย", "วรรณา", "อรุณ", "ประยุทธ์", "จันทร์โอชา", "กิตติ", "ศรีสุข"]
+
+
+# ============== Previous Approach ==============
+def dict_name_numbers(name: str) -> Dict[str, int]:
+    """Romanize, strip accents and sum letter by letter with dictionary lookups"""
+    import unicodedata
+
+    name = re.sub("[ก-ฮ][ัิ-ฺ็-๋]?์", "", name)
+    latin = "".join(THAI_TRANSLITERATION.get(ch, ch) for ch in name)
+    latin = unicodedata.normalize("NFKD", latin).upper()
+    total = vowels = 0
+    for ch in latin:
+        value = PYTHAGOREAN_VALUES.get(ch)
+        if value:
+            total += value
+            if ch in VOWELS:
+                vowels += value
+    return {
+        "expression": numerology.reduce_number(total),
+        "soul_urge": numerology.reduce_number(vowels),
+        "personality": numerology.reduce_number(total - vowels),
+    }
+
+
+def synthetic_names(count: int) -> List[str]:
+    """Two-part names, half Latin and half Thai"""
+    rng = random.Random(0)
+    return [
+        f"{rng.choice(parts)} {rng.choice(parts)}"
+        for parts in (rng.choice((LATIN_PARTS, THAI_PARTS)) for _ in range(count))
+    ]
+
+
+def per_name_ns(func, names: List[str]) -> float:
+    began = time.perf_counter()
+    func(names)
+    return (time.perf_counter() - began) / len(names) * 1e9
+
+
+def main(argv=None) -> None:
+    """Print the per-name cost of each approach"""
+    parser = argparse.ArgumentParser(description="Measure name numerology scoring")
+    parser.add_argument("--names", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    names = synthetic_names(args.names)
+    batch = numerology.name_numbers_batch(names)
+    sample = names[:10_000]
+    for i, name in enumerate(sample):
+        expected = dict_name_numbers(name)
+        assert numerology.name_numbers(name) == expected, name
+        assert {field: int(batch[field][i]) for field in expected} == expected, name
+
+    cases = {
+        "dict per name": lambda items: [dict_name_numbers(name) for name in items],
+        "tables per name": lambda items: [numerology.name_numbers(name) for name in items],
+        "tables batch": numerology.name_numbers_batch,
+    }
+    print(f"{'scorer':<18}{'ns/name':>12}")
+    for label, func in cases.items():
+        print(f"{label:<18}{per_name_ns(func, names):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Numerology Micro-Benchmark
+Compares the nested digit-sum loops the getters used to run against core.numerology,
+for single calls and for whole arrays of birth dates
+
+Run from the repository root:
+    python -m benchmarks.bench_numerology
+    python -m benchmarks.bench_numerology --dates 1000000
+"""
+
+import argparse
+import timeit
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from core import numerology
+
+
+# ============== Previous Implementations ==============
+def loop_reduce(n: int, keep_master: bool = True) -> int:
+    """Repeated digit sum with an inner division loop, as the getters used to run"""
+    while n > 9 and not (keep_master and n in [11, 22]):
+        s = 0
+        while n > 0:
+            s += n % 10
+            n //= 10
+        n = s
+    return n
+
+
+def loop_life_path(day: int, month: int, year: int) -> int:
+    return loop_reduce(loop_reduce(day) + loop_reduce(month) + loop_reduce(year))
+
+
+def loop_penta(day: int) -> int:
+    return loop_reduce((day * (3 * day - 1)) // 2, keep_master=False)
+
+
+def loop_array_reduce(values: np.ndarray, keep_master: bool = True) -> np.ndarray:
+    """Masked NumPy digit-sum loop, as calculate_batch used to run"""
+    n = values.astype(np.int64, copy=True)
+    while True:
+        pending = n > 9
+        if keep_master:
+            pending &= (n != 11) & (n != 22)
+        if not pending.any():
+            return n
+        rest = n[pending]
+        total = np.zeros_like(rest)
+        while rest.any():
+            total += rest % 10
+            rest //= 10
+        n[pending] = total
+
+
+def loop_array_life_path(day: np.ndarray, month: np.ndarray, year: np.ndarray) -> np.ndarray:
+    return loop_array_reduce(loop_array_reduce(day) + loop_array_reduce(month) + loop_array_reduce(year))
+
+
+def loop_array_penta(day: np.ndarray) -> np.ndarray:
+    return loop_array_reduce((day * (3 * day - 1)) // 2, keep_master=False)
+
+
+SCALAR_CASES: Dict[str, Tuple[Callable, Callable]] = {
+    "life_path": (loop_life_path, numerology.life_path_number),
+    "penta": (lambda d, m, y: loop_penta(d), lambda d, m, y: numerology.penta_number(d)),
+}
+
+ARRAY_CASES: Dict[str, Tuple[Callable, Callable]] = {
+    "life_path": (loop_array_life_path, numerology.life_path_number),
+    "penta": (lambda d, m, y: loop_array_penta(d), lambda d, m, y: numerology.penta_number(d)),
+}
+
+
+def date_columns(count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Day, month and year arrays for ``count`` consecutive dates from 1900-01-01"""
+    dates = np.datetime64("1900-01-01") + np.arange(count)
+    months = dates.astype("datetime64[M]")
+    year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months).astype(np.int64) + 1
+    return day, month, year
+
+
+def main(argv=None) -> None:
+    """Print before/after cost per date for scalar calls and array batches"""
+    parser = argparse.ArgumentParser(description="Measure table-driven numerology")
+    parser.add_argument("--dates", type=int, default=73049, help="consecutive dates from 1900-01-01")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    day, month, year = date_columns(args.dates)
+    rows = list(zip(day.tolist(), month.tolist(), year.tolist()))
+
+    print(f"{'case':<18}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    for name, (before, after) in SCALAR_CASES.items():
+        assert [before(*row) for row in rows] == [after(*row) for row in rows], name
+
+        before_ns, after_ns = (
+            min(timeit.repeat(lambda: [func(*row) for row in rows], number=1, repeat=args.number))
+            / len(rows) * 1e9
+            for func in (before, after)
+        )
+        print(f"{'scalar ' + name:<18}{before_ns:>14.1f}{after_ns:>14.1f}{before_ns / after_ns:>9.1f}x")
+
+    for name, (before, after) in ARRAY_CASES.items():
+        assert np.array_equal(before(day, month, year), after(day, month, year)), name
+
+        before_ns, after_ns = (
+            min(timeit.repeat(lambda: func(day, month, year), number=1, repeat=args.number))
+            / len(rows) * 1e9
+            for func in (before, after)
+        )
+        print(f"{'array ' + name:<18}{before_ns:>14.2f}{after_ns:>14.2f}{before_ns / after_ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
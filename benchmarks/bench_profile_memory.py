@@ -0,0 +1,50 @@
+"""
+Profile Memory Benchmark
+Compares the footprint of calculate_all dicts with compact AstroProfile objects
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_memory
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, List
+import copy
+import tracemalloc
+
+from core.calculators import AstrologicalCalculator
+from core.profile import AstroProfile
+
+
+def traced_bytes(build: Callable[[], List]) -> int:
+    """Bytes still allocated after build() returns, while its result is alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main(count: int = 40000) -> None:
+    """Print bytes per profile for both representations"""
+    start = datetime(1900, 1, 1)
+    dates = [start + timedelta(days=i) for i in range(count)]
+    as_of = datetime.now()
+
+    # Deep copies give every dict its own nested dicts, as independent callers hold them
+    dict_bytes = traced_bytes(lambda: [copy.deepcopy(AstrologicalCalculator.calculate_all(d, as_of)) for d in dates])
+    slot_bytes = traced_bytes(lambda: [AstroProfile.from_date(d) for d in dates])
+
+    # Every tenth date, so master life-path numbers 11 and 22 are covered
+    for d in dates[::10]:
+        assert AstroProfile.from_date(d).to_dict(as_of) == AstrologicalCalculator.calculate_all(d, as_of)
+
+    print(f"profiles: {len(dates)}")
+    print(f"calculate_all dicts: {dict_bytes / len(dates):8.0f} bytes each")
+    print(f"AstroProfile:        {slot_bytes / len(dates):8.0f} bytes each")
+    print(f"reduction:           {dict_bytes / slot_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
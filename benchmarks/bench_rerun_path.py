@@ -0,0 +1,85 @@
+"""
+Rerun Path Benchmark
+Measures the generator and lucky-element work app.py repeats on every Streamlit rerun
+
+Run from the repository root:
+    python -m benchmarks.bench_rerun_path
+"""
+
+from typing import Callable, Dict
+import time
+import tracemalloc
+
+from core.predictors import PredictionGenerator, PREDICTION_TEMPLATES
+
+
+def legacy_lucky_elements(lang: str, life_path: int) -> Dict:
+    """get_lucky_elements as it was: a three-language dict rebuilt per call"""
+    lucky_data = {
+        "th": {
+            "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
+            "colors": ["ฟ้า", "เขียว", "ทอง"],
+            "days": ["พุธ", "พฤหัสบดี", "ศุกร์"],
+        },
+        "en": {
+            "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
+            "colors": ["Blue", "Green", "Gold"],
+            "days": ["Wednesday", "Thursday", "Friday"],
+        },
+        "zh": {
+            "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
+            "colors": ["蓝色", "绿色", "金色"],
+            "days": ["周三", "周四", "周五"],
+        },
+    }
+    return lucky_data.get(lang, lucky_data["en"])
+
+
+def legacy_rerun(data: Dict) -> Dict:
+    """Two fresh generators plus a rebuilt lucky dict, as app.py did per rerun"""
+    PredictionGenerator("th")
+    PredictionGenerator("th")
+    return legacy_lucky_elements("th", data["numerology"]["life_path"])
+
+
+def shared_rerun(data: Dict) -> Dict:
+    """Shared generator and precomputed lucky-element lookup"""
+    return PredictionGenerator.for_language("th").get_lucky_elements(data)
+
+
+def measure(func: Callable[[Dict], Dict], data: Dict, calls: int):
+    """(nanoseconds per call, peak bytes allocated during one call)"""
+    func(data)
+    began = time.perf_counter()
+    for _ in range(calls):
+        func(data)
+    per_call_ns = (time.perf_counter() - began) / calls * 1e9
+
+    # Peak transient bytes of one call above what was already allocated
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_call_ns, peak - before
+
+
+def main(calls: int = 200000) -> None:
+    """Print per-call latency and allocation for both rerun paths"""
+    data = {"numerology": {"life_path": 7}}
+    for lang in PREDICTION_TEMPLATES:
+        for life_path in (1, 7, 11, 22):
+            sample = {"numerology": {"life_path": life_path}}
+            legacy = legacy_lucky_elements(lang, life_path)
+            shared = PredictionGenerator.for_language(lang).get_lucky_elements(sample)
+            assert {k: list(v) for k, v in shared.items()} == legacy
+
+    print(f"{'path':<8}{'ns/call':>12}{'peak bytes':>14}")
+    for name, func in (("legacy", legacy_rerun), ("shared", shared_rerun)):
+        ns, allocated = measure(func, data, calls)
+        print(f"{name:<8}{ns:>12.0f}{allocated:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Sign Lookup Micro-Benchmark
+Compares the per-call scans the getters used to run against the day-of-year tables
+
+Run from the repository root:
+    python -m benchmarks.bench_sign_tables
+"""
+
+import timeit
+from typing import Callable, Dict, Tuple
+
+from core.calculators import (
+    AstrologicalCalculator,
+    MOON_SIGNS,
+    VEDIC_SIGNS,
+    WESTERN_ZODIAC,
+)
+
+
+# ============== Previous Implementations ==============
+def scan_western_zodiac(month: int, day: int) -> Tuple[str, str]:
+    """Western sign by sorting and scanning WESTERN_ZODIAC on every call"""
+    for (m, d), signs in sorted(WESTERN_ZODIAC.items(), key=lambda x: (-x[0][0], -x[0][1])):
+        if (month == m and day >= d) or (month > m):
+            return signs
+    return ("Capricorn", "มู่คัส / กุมภะ")
+
+
+def divide_moon_sign(month: int, day: int) -> Tuple[str, str]:
+    """Moon sign by float division on every call"""
+    day_of_year = (month - 1) * 30 + day
+    return MOON_SIGNS[int(day_of_year / 2.5) % 12]
+
+
+def divide_vedic_sign(month: int, day: int) -> Tuple[str, str, str]:
+    """Vedic sign by float division on every call"""
+    day_of_year = (month - 1) * 30 + day
+    return VEDIC_SIGNS[int(day_of_year / 30.4) % 12]
+
+
+CASES: Dict[str, Tuple[Callable, Callable]] = {
+    "western_zodiac": (scan_western_zodiac, AstrologicalCalculator.get_western_zodiac),
+    "moon_sign": (divide_moon_sign, AstrologicalCalculator.get_moon_sign),
+    "vedic_sign": (divide_vedic_sign, AstrologicalCalculator.get_vedic_sign),
+}
+
+# A spread of dates across the year, including both ends of the table
+SAMPLE_DATES = [(1, 1), (2, 29), (3, 21), (6, 15), (9, 23), (12, 22), (12, 31)]
+
+
+def per_call_ns(func: Callable, number: int) -> float:
+    """Best-of-five cost of one call in nanoseconds"""
+    def run():
+        for month, day in SAMPLE_DATES:
+            func(month, day)
+    
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(SAMPLE_DATES)) * 1e9
+
+
+def main(number: int = 20000) -> None:
+    """Print before/after cost per call for each getter"""
+    print(f"{'getter':<16}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    for name, (before, after) in CASES.items():
+        for month, day in SAMPLE_DATES:
+            assert before(month, day) == after(month, day), (name, month, day)
+        
+        before_ns = per_call_ns(before, number)
+        after_ns = per_call_ns(after, number)
+        print(f"{name:<16}{before_ns:>14.1f}{after_ns:>14.1f}{before_ns / after_ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
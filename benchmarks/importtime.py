@@ -0,0 +1,95 @@
+"""
+Import Time Benchmark
+Measures cold import cost of core and utils (and optionally app.py's imports) with
+``python -X importtime`` and fails when it exceeds a budget or pulls in heavy modules
+
+Run from the repository root:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --budget-ms 60 --top 15
+"""
+
+from typing import List, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not load until a batch API, the index or metrics is used
+DEFERRED_MODULES = ("numpy", "pandas", "http.server")
+
+
+def import_profile(statement: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every module statement imports
+
+    Interpreter startup (everything up to and including site) is dropped.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Keep the indentation -X importtime uses to show nesting
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    names = [name for name, _, _ in rows]
+    return rows[names.index("site") + 1:] if "site" in names else rows
+
+
+def top_level(rows: List[Tuple[str, int, int]]) -> List[Tuple[str, int, int]]:
+    """Rows not nested inside another import in the same profile"""
+    return [row for row in rows if row[0] == row[0].lstrip()]
+
+
+def loaded_modules(statement: str, names: Tuple[str, ...]) -> List[str]:
+    """Which of names are in sys.modules after running statement in a fresh interpreter"""
+    probe = f"{statement}; import sys; print(','.join(n for n in {names!r} if n in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; returns 1 when over budget or a deferred module loads"""
+    parser = argparse.ArgumentParser(description="Measure cold import time of the horoscope core")
+    parser.add_argument("--statement", default="import core, utils", help="code to time")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="allowed cumulative import time")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--repeat", type=int, default=5, help="runs to take the best total from")
+    args = parser.parse_args(argv)
+
+    best_total, best_rows = None, []
+    for _ in range(args.repeat):
+        rows = import_profile(args.statement)
+        # Cumulative times nest, so the total is the sum over top-level imports
+        total = sum(cumulative for _, _, cumulative in top_level(rows))
+        if best_total is None or total < best_total:
+            best_total, best_rows = total, rows
+
+    print(f"{args.statement!r}: {best_total / 1000:.1f} ms (best of {args.repeat})")
+    for name, self_us, cumulative_us in sorted(best_rows, key=lambda row: -row[2])[:args.top]:
+        print(f"  {name.strip():<40}{cumulative_us / 1000:>10.1f} ms cumulative{self_us / 1000:>10.1f} ms self")
+
+    failures = []
+    deferred = loaded_modules(args.statement, DEFERRED_MODULES)
+    if deferred:
+        failures.append(f"imported eagerly: {', '.join(deferred)}")
+    if best_total / 1000 > args.budget_ms:
+        failures.append(f"{best_total / 1000:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Service Load Test
+Drives service.py with concurrent keep-alive clients and reports latency and throughput
+
+Start the service, then run from the repository root:
+    python service.py --port 8080
+    python -m benchmarks.loadtest --port 8080 --clients 32 --duration 10
+"""
+
+from datetime import date, timedelta
+from typing import List
+import argparse
+import asyncio
+import random
+import time
+
+
+PATHS = [
+    "/profile?birth_date={date}",
+    "/prediction?birth_date={date}&period=daily&lang=th",
+    "/prediction?birth_date={date}&period=weekly&lang=en",
+    "/prediction?birth_date={date}&period=monthly&lang=zh",
+    "/lucky?birth_date={date}&lang=en",
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def client(host: str, port: int, deadline: float, latencies: List[float], errors: List[int], seed: int) -> None:
+    """Send requests over one keep-alive connection until the deadline"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            birth_date = date(1900, 1, 1) + timedelta(days=rng.randrange(45000))
+            path = rng.choice(PATHS).format(date=birth_date.isoformat())
+            request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n"
+
+            started = time.perf_counter()
+            writer.write(request.encode("latin-1"))
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(int(head[9:12]))
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, clients: int, duration: float) -> None:
+    latencies: List[float] = []
+    errors: List[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(client(host, port, deadline, latencies, errors, seed) for seed in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"clients={clients} duration={elapsed:.1f}s requests={len(latencies)} non_200={len(errors)}")
+    print(f"requests/s={len(latencies) / elapsed:.1f}")
+    print(f"p50={percentile(latencies, 50) * 1000:.2f}ms p99={percentile(latencies, 99) * 1000:.2f}ms")
+
+
+def main(argv=None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Load-test the horoscope JSON service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.host, args.port, args.clients, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Benchmark Runner
+Times the core calculators, predictors and a headless Streamlit rerun, writes JSON
+results and fails when any case regresses past a threshold against a saved baseline
+
+Run from the repository root:
+    python -m benchmarks.run --save-baseline          # record benchmarks/baseline.json
+    python -m benchmarks.run --threshold 0.25         # compare, exit 1 on regression
+    python -m benchmarks.run --filter predictor --output results.json
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List
+import argparse
+import inspect
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from core.calculators import AstrologicalCalculator
+from core.predictors import PredictionGenerator, SEED_VERSION_MD5, SEED_VERSION_TABLE
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+# 1990-01-01 has an ordinary life path (3), so every path below can run on it
+BIRTH_DATE = datetime(1990, 1, 1)
+AS_OF = datetime(2026, 1, 1)
+PROFILE = AstrologicalCalculator.calculate_all(BIRTH_DATE, AS_OF)
+BATCH_DATES = np.datetime64("1900-01-01") + np.arange(0, 45000, 45)
+NAME = "Somchai Jaidee"
+BATCH_NAMES = [NAME, "สมชาย ใจดี"] * 500
+
+
+def calculator_cases() -> Dict[str, Callable[[], object]]:
+    calc = AstrologicalCalculator
+    return {
+        "calculator.get_western_zodiac": lambda: calc.get_western_zodiac(1, 1),
+        "calculator.get_chinese_zodiac": lambda: calc.get_chinese_zodiac(1990),
+        "calculator.get_moon_sign": lambda: calc.get_moon_sign(1, 1, 1990),
+        "calculator.get_vedic_sign": lambda: calc.get_vedic_sign(1, 1),
+        "calculator.get_life_path_number": lambda: calc.get_life_path_number(1, 1, 1990),
+        "calculator.get_destiny_number": lambda: calc.get_destiny_number(1, 1, 1990, NAME),
+        "calculator.get_name_numbers": lambda: calc.get_name_numbers(NAME),
+        "calculator.get_karma_number": lambda: calc.get_karma_number(1),
+        "calculator.get_soul_urge_number": lambda: calc.get_soul_urge_number(1, 1),
+        "calculator.get_personality_number": lambda: calc.get_personality_number(1),
+        "calculator.get_chinese_element": lambda: calc.get_chinese_element(1990),
+        "calculator.get_buddhist_era": lambda: calc.get_buddhist_era(1990),
+        "calculator.get_biorhythm": lambda: calc.get_biorhythm(1, 1, 1990, AS_OF),
+        "calculator.get_biorhythm_for_days": lambda: calc.get_biorhythm_for_days(13149),
+        "calculator.get_biorhythm_range": lambda: calc.get_biorhythm_range(BIRTH_DATE, AS_OF, 30),
+        "calculator.get_biorhythm_range_batch": lambda: calc.get_biorhythm_range_batch(BATCH_DATES, AS_OF, 30),
+        "calculator.get_penta_number": lambda: calc.get_penta_number(1),
+        "calculator.get_lucky_direction": lambda: calc.get_lucky_direction(1),
+        "calculator.get_profile_codes": lambda: calc.get_profile_codes(1990, 1, 1),
+        "calculator.calculate_static_profile": lambda: calc.calculate_static_profile(BIRTH_DATE),
+        "calculator.calculate_overlay": lambda: calc.calculate_overlay(BIRTH_DATE, AS_OF),
+        "calculator.calculate_all": lambda: calc.calculate_all(BIRTH_DATE, AS_OF),
+        "calculator.calculate_all_cold": lambda: (
+            calc._static_profile.cache_clear(), calc.calculate_all(BIRTH_DATE, AS_OF)
+        ),
+        "calculator.calculate_batch": lambda: calc.calculate_batch(BATCH_DATES, AS_OF),
+        "calculator.iter_profiles": lambda: list(calc.iter_profiles(BATCH_DATES, 250, AS_OF)),
+        "calculator.get_name_numbers_batch": lambda: calc.get_name_numbers_batch(BATCH_NAMES),
+    }
+
+
+def predictor_cases() -> Dict[str, Callable[[], object]]:
+    generator = PredictionGenerator.for_language("th", SEED_VERSION_MD5)
+    table_generator = PredictionGenerator.for_language("th", SEED_VERSION_TABLE)
+    return {
+        "predictor.generate_daily_prediction": lambda: generator.generate_daily_prediction(PROFILE, BIRTH_DATE),
+        "predictor.generate_weekly_forecast": lambda: generator.generate_weekly_forecast(PROFILE, BIRTH_DATE),
+        "predictor.generate_monthly_outlook": lambda: generator.generate_monthly_outlook(PROFILE, BIRTH_DATE),
+        "predictor.generate_prediction_codes": lambda: generator.generate_prediction_codes(PROFILE, BIRTH_DATE),
+        "predictor.generate_batch": lambda: generator.generate_batch(BATCH_DATES, "daily"),
+        "predictor.get_lucky_elements": lambda: generator.get_lucky_elements(PROFILE),
+        "predictor.generate_prediction_codes_v2": lambda: table_generator.generate_prediction_codes(
+            PROFILE, BIRTH_DATE
+        ),
+        "predictor.generate_batch_v2": lambda: table_generator.generate_batch(BATCH_DATES, "daily"),
+        "predictor.generate_calendar_365": lambda: generator.generate_calendar(BIRTH_DATE, AS_OF, 365),
+    }
+
+
+def app_cases() -> Dict[str, Callable[[], object]]:
+    """Headless app.main() reruns through Streamlit's testing harness"""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return {}
+
+    app = AppTest.from_file(os.path.join(REPO_DIR, "app.py"), default_timeout=60)
+    app.run()
+    # Submit the default birth date so reruns render the full results page
+    app.button[0].click().run()
+    periods = ["daily", "weekly", "monthly"]
+
+    def switch_period() -> None:
+        period = periods[(periods.index(app.radio[0].value) + 1) % len(periods)]
+        app.radio[0].set_value(period).run()
+
+    return {
+        "app.rerun": lambda: app.run(),
+        "app.period_switch": switch_period,
+    }
+
+
+def uncovered_static_methods(cases: Dict[str, Callable]) -> List[str]:
+    """Public AstrologicalCalculator static methods without a benchmark case"""
+    covered = {name.split(".", 1)[1] for name in cases if name.startswith("calculator.")}
+    return [
+        name for name, _ in inspect.getmembers(AstrologicalCalculator, inspect.isfunction)
+        if not name.startswith("_") and name not in covered and name != "load_profile_index"
+    ]
+
+
+def time_case(func: Callable[[], object], min_time: float) -> Dict[str, float]:
+    """Best per-call time over five repeats of an auto-sized loop"""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=5, number=number))
+    return {"ns_per_call": round(best / number * 1e9, 1), "calls": number}
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Lines describing every case slower than baseline by more than threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        ratio = current["ns_per_call"] / previous["ns_per_call"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {previous['ns_per_call']:.0f} -> {current['ns_per_call']:.0f} ns ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; returns 1 when a regression is found"""
+    parser = argparse.ArgumentParser(description="Run the horoscope predictor benchmark suite")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--output", default=None, help="write JSON results to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing loop")
+    parser.add_argument("--no-app", action="store_true", help="skip the Streamlit rerun cases")
+    args = parser.parse_args(argv)
+
+    cases = {**calculator_cases(), **predictor_cases()}
+    missing = uncovered_static_methods(cases)
+    if missing:
+        print(f"warning: no benchmark case for {', '.join(missing)}", file=sys.stderr)
+    # Building the app harness is slow, so only do it when app cases can match the filter
+    if not args.no_app and (not args.filter or "app" in args.filter):
+        cases.update(app_cases())
+
+    results = {}
+    for name, func in cases.items():
+        if args.filter not in name:
+            continue
+        results[name] = time_case(func, args.min_time)
+        print(f"{name:<45}{results[name]['ns_per_call']:>16,.1f} ns")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
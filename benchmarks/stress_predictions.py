@@ -0,0 +1,71 @@
+"""
+Concurrent Prediction Stress Check
+Generates predictions from many threads at once and compares every result with a
+serial run of the previous global-RNG sampler
+
+Run from the repository root:
+    python -m benchmarks.stress_predictions
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+import hashlib
+import random
+import sys
+import time
+
+from core.predictors import PREDICTION_TEMPLATES, PredictionGenerator
+
+
+CATEGORIES = ["financial", "career", "love", "health", "family", "education"]
+PERIODS = ["daily", "weekly", "monthly"]
+
+
+def reference_predictions(lang: str, birth_date: datetime, period: str) -> Dict[str, List[str]]:
+    """Predictions exactly as the global random.seed / random.sample code produced them"""
+    templates = PREDICTION_TEMPLATES[lang]
+    predictions = {}
+    for category in CATEGORIES:
+        seed_str = f"{birth_date.strftime('%Y%m%d')}_{category}_{period}"
+        random.seed(int(hashlib.md5(seed_str.encode()).hexdigest()[:8], 16))
+        available = templates[category]
+        predictions[category] = random.sample(available, min(3, len(available)))
+    return predictions
+
+
+def generate(case: Tuple[str, datetime, str]) -> Dict[str, List[str]]:
+    """Run one generation through the public API"""
+    lang, birth_date, period = case
+    generator = PredictionGenerator(lang)
+    if period == "daily":
+        result = generator.generate_daily_prediction({}, birth_date)
+    elif period == "weekly":
+        result = generator.generate_weekly_forecast({}, birth_date)
+    else:
+        result = generator.generate_monthly_outlook({}, birth_date)
+    return result["predictions"]
+
+
+def main(generations: int = 20000, workers: int = 32) -> int:
+    """Return a process exit code: 0 when every concurrent result matches"""
+    rng = random.Random(0)
+    start = datetime(1900, 1, 1)
+    cases = [
+        (rng.choice(list(PREDICTION_TEMPLATES)), start + timedelta(days=rng.randrange(46000)), rng.choice(PERIODS))
+        for _ in range(generations)
+    ]
+    expected = [reference_predictions(*case) for case in cases]
+
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(generate, cases, chunksize=16))
+    elapsed = time.perf_counter() - began
+
+    mismatches = sum(1 for got, want in zip(results, expected) if got != want)
+    print(f"{generations} generations on {workers} threads in {elapsed:.2f}s, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
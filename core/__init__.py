@@ -2,10 +2,36 @@
 Core Module - Horoscope Predictor Core
 """
 
+import importlib
+import os
+
 from .calculators import AstrologicalCalculator
-from .predictors import PredictionGenerator
+from .predictors import PredictionGenerator, render_prediction
+from .profile import AstroProfile
+from .cache import PredictionCache, get_cached_prediction
+from .cohort import CohortBatch, compute_cohorts, merge_cohorts
+
+# metrics is imported on first access so a plain import stays cheap; it is
+# imported eagerly only when HOROSCOPE_METRICS=1 asks for instrumentation
+if os.environ.get("HOROSCOPE_METRICS") == "1":
+    from . import metrics
+
+
+def __getattr__(name):
+    if name == "metrics":
+        return importlib.import_module(".metrics", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'AstrologicalCalculator',
     'PredictionGenerator',
+    'render_prediction',
+    'AstroProfile',
+    'PredictionCache',
+    'get_cached_prediction',
+    'CohortBatch',
+    'compute_cohorts',
+    'merge_cohorts',
+    'metrics',
 ]
@@ -0,0 +1,111 @@
+"""
+Prediction Cache Module
+Process-wide LRU cache of predictions shared by every session and thread
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import threading
+
+from .predictors import PredictionGenerator, render_prediction
+
+
+class PredictionCache:
+    """Size-bounded LRU keyed by (birth_date, period, lang, day)
+
+    lang is None for language-neutral entries. Entries expire at the local day
+    boundary: the first access on a new day drops everything cached on earlier days.
+    """
+
+    def __init__(self, maxsize: int = 10000, clock: Callable[[], datetime] = datetime.now):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._bucket: Optional[date] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _key(self, birth_date: date, period: str, lang: Optional[str]) -> Tuple[Hashable, ...]:
+        """Cache key for the current day bucket, expiring older buckets first"""
+        bucket = self.clock().date()
+        if bucket != self._bucket:
+            self.expirations += len(self._entries)
+            self._entries.clear()
+            self._bucket = bucket
+        if isinstance(birth_date, datetime):
+            birth_date = birth_date.date()
+        return (birth_date, period, lang, bucket)
+
+    def get_or_compute(
+        self,
+        birth_date: date,
+        period: str,
+        lang: Optional[str],
+        compute: Callable[[], Dict]
+    ) -> Dict:
+        """Return the cached prediction, computing and storing it on a miss
+
+        compute runs outside the lock; if two threads miss on the same key at
+        once, both compute the same deterministic result and one is kept. A
+        result whose day bucket expired during compute is returned but not stored.
+        """
+        with self._lock:
+            key = self._key(birth_date, period, lang)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            # Another lookup rolled the day over while this one computed
+            if key[-1] != self._bucket:
+                return value
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        """Counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every Streamlit session in this process
+prediction_cache = PredictionCache()
+
+
+def get_cached_prediction(astrological_data: Dict, birth_date: datetime, period: str, lang: str) -> Dict:
+    """Daily, weekly or monthly prediction served from the process-wide cache
+
+    The cache holds one language-neutral entry per (birth_date, period, day),
+    which is rendered into lang on every call, so all locales share it.
+    """
+    def compute() -> Dict:
+        return PredictionGenerator.for_language(lang).generate_prediction_codes(astrological_data, birth_date, period)
+
+    codes = prediction_cache.get_or_compute(birth_date, period, None, compute)
+    return render_prediction(codes, lang)
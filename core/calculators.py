@@ -4,9 +4,16 @@ Handles all astrological sign and calculation computations
 """
 
 from datetime import datetime
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, Iterable, Iterator, List, Optional, TYPE_CHECKING
+import functools
+import itertools
 import math
 
+from . import lunar, numerology
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # ============== Zodiac Data ==============
 WESTERN_ZODIAC = {
@@ -25,6 +32,9 @@ WESTERN_ZODIAC = {
     (12, 31): ("Capricorn", "มู่คัส / กุมภะ"),
 }
 
+# Distinct western signs in table order; batch results use these positions as codes
+WESTERN_SIGNS = list(dict.fromkeys(WESTERN_ZODIAC.values()))
+
 CHINESE_ZODIAC_ANIMALS = {
     0: ("Rat", "หนู"),
     1: ("Ox", "วัว"),
@@ -95,19 +105,95 @@ NUMEROLOGY_TRAITS = {
     7: ("Spirituality", "การวิเคราะห์, ลึกลับ, สงบ"),
     8: ("Power", "ความสำเร็จ, อำนาจ, ความมั่งคั่ง"),
     9: ("Humanitarianism", "เมตตากรุณา, ใจกว้าง, เสียสละ"),
+    # Master numbers, which life path reduction keeps unreduced
+    11: ("Illumination", "สัญชาตญาณ, แรงบันดาลใจ, มองการณ์ไกล"),
+    22: ("Master Builder", "วิสัยทัศน์, สร้างสิ่งยิ่งใหญ่, ทำฝันให้เป็นจริง"),
+}
+
+
+# ============== Day-of-Year Sign Tables ==============
+# Leap-year month offsets so every (month, day) pair, Feb 29 included, has a slot
+_MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _western_sign_index(month: int, day: int) -> int:
+    """Scan WESTERN_ZODIAC boundaries for a (month, day) pair"""
+    for (m, d), signs in sorted(WESTERN_ZODIAC.items(), key=lambda x: (-x[0][0], -x[0][1])):
+        if (month == m and day >= d) or (month > m):
+            return WESTERN_SIGNS.index(signs)
+    return WESTERN_SIGNS.index(("Capricorn", "มู่คัส / กุมภะ"))
+
+
+def _build_day_table(sign_index) -> Tuple[int, ...]:
+    """Evaluate a (month, day) -> sign index rule for all 366 days of a leap year"""
+    return tuple(
+        sign_index(month, day)
+        for month, days in enumerate(_DAYS_IN_MONTH, start=1)
+        for day in range(1, days + 1)
+    )
+
+
+# Ordinal day (0-365) -> index into WESTERN_SIGNS / MOON_SIGNS / VEDIC_SIGNS.
+# The moon rule ignores the year; it only covers dates outside core.lunar's table.
+WESTERN_SIGN_BY_DAY = _build_day_table(_western_sign_index)
+MOON_SIGN_BY_DAY = _build_day_table(lambda m, d: int(((m - 1) * 30 + d) / 2.5) % 12)
+VEDIC_SIGN_BY_DAY = _build_day_table(lambda m, d: int(((m - 1) * 30 + d) / 30.4) % 12)
+
+
+def day_index(month: int, day: int) -> int:
+    """Ordinal slot (0-365) of a (month, day) pair in the sign tables"""
+    return _MONTH_OFFSETS[month - 1] + day - 1
+
+
+# ============== Biorhythm Phase Tables ==============
+# Physical: 23-day cycle, Emotional: 28-day cycle, Intellectual: 33-day cycle
+BIORHYTHM_CYCLES = {"physical": 23, "emotional": 28, "intellectual": 33}
+
+# Rounded curve value (0-100) for every phase of each cycle; days lived % period indexes it
+BIORHYTHM_PHASES = {
+    name: tuple(round(50 + 50 * math.sin(2 * math.pi * phase / period), 1) for phase in range(period))
+    for name, period in BIORHYTHM_CYCLES.items()
 }
 
 
+# Integer code layout shared by get_profile_codes and the prebuilt profile index
+PROFILE_CODE_FIELDS = (
+    "western_sign",
+    "chinese_animal",
+    "chinese_element",
+    "moon_sign",
+    "vedic_sign",
+    "life_path",
+    "karma_number",
+    "soul_urge",
+    "personality",
+    "penta_number",
+)
+
+# Memory-mapped ProfileIndex attached by AstrologicalCalculator.load_profile_index
+_PROFILE_INDEX = None
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """Lazily split any iterable into lists of at most size items"""
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class AstrologicalCalculator:
     """Main calculator for astrological computations"""
     
     @staticmethod
     def get_western_zodiac(month: int, day: int) -> Tuple[str, str]:
         """Get Western zodiac sign with Thai name"""
-        for (m, d), signs in sorted(WESTERN_ZODIAC.items(), key=lambda x: (-x[0][0], -x[0][1])):
-            if (month == m and day >= d) or (month > m):
-                return signs
-        return ("Capricorn", "มู่คัส / กุมภะ")
+        return WESTERN_SIGNS[WESTERN_SIGN_BY_DAY[day_index(month, day)]]
     
     @staticmethod
     def get_chinese_zodiac(year: int) -> Tuple[str, str, str, str]:
@@ -126,65 +212,60 @@ class AstrologicalCalculator:
         )
     
     @staticmethod
-    def get_moon_sign(month: int, day: int) -> Tuple[str, str]:
-        """Calculate Moon sign based on birth date"""
-        # Approximate calculation: Moon changes signs every ~2.5 days
-        day_of_year = (month - 1) * 30 + day
-        sign_index = int(day_of_year / 2.5) % 12
-        return MOON_SIGNS[sign_index]
+    def get_moon_sign(month: int, day: int, year: Optional[int] = None) -> Tuple[str, str]:
+        """Calculate Moon sign based on birth date
+        
+        With a year in 1900-2100 the sign comes from the lunar ingress table
+        (see core.lunar); otherwise it falls back to a ~2.5-day approximation.
+        """
+        return MOON_SIGNS[AstrologicalCalculator._moon_sign_index(year, month, day)]
+    
+    @staticmethod
+    def _moon_sign_index(year: Optional[int], month: int, day: int) -> int:
+        if year is not None:
+            sign = lunar.moon_sign_on(year, month, day)
+            if sign is not None:
+                return sign
+        return MOON_SIGN_BY_DAY[day_index(month, day)]
     
     @staticmethod
     def get_vedic_sign(month: int, day: int) -> Tuple[str, str, str]:
         """Get Vedic (Indian) astrology sign"""
         # Vedic signs are offset from Western by approximately Aries = Mesha
-        day_of_year = (month - 1) * 30 + day
-        sign_index = int(day_of_year / 30.4) % 12
-        return VEDIC_SIGNS[sign_index]
+        return VEDIC_SIGNS[VEDIC_SIGN_BY_DAY[day_index(month, day)]]
     
     @staticmethod
     def get_life_path_number(day: int, month: int, year: int) -> int:
         """Calculate Life Path Number using Pythagorean method"""
-        def reduce_number(n: int) -> int:
-            while n > 9 and n not in [11, 22]:
-                s = 0
-                while n > 0:
-                    s += n % 10
-                    n //= 10
-                n = s
-            return n
-        
-        day_sum = reduce_number(day)
-        month_sum = reduce_number(month)
-        year_sum = reduce_number(year)
-        
-        total = day_sum + month_sum + year_sum
-        return reduce_number(total)
+        return numerology.life_path_number(day, month, year)
     
     @staticmethod
-    def get_destiny_number(day: int, month: int, year: int) -> int:
-        """Calculate Destiny (Expression) Number"""
-        # Use Pythagorean numerology for name conversion
-        pythagorean = {
-            'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
-            'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'O': 6, 'P': 7, 'Q': 8, 'R': 9,
-            'S': 1, 'T': 2, 'U': 3, 'V': 4, 'W': 5, 'X': 6, 'Y': 7, 'Z': 8
-        }
-        return 0  # Placeholder - would need name input
+    def get_destiny_number(day: int, month: int, year: int, name: str = "") -> int:
+        """Calculate Destiny (Expression) Number from a full Latin or Thai name
+        
+        Only the name's letters count; without a name the result is 0.
+        """
+        return numerology.expression_number(name)
     
     @staticmethod
     def get_karma_number(day: int) -> int:
         """Karma number based on birth day"""
-        return day % 9 if day % 9 != 0 else 9
+        return numerology.karma_number(day)
     
     @staticmethod
     def get_soul_urge_number(month: int, day: int) -> int:
         """Soul Urge (Heart's Desire) Number"""
-        return AstrologicalCalculator.get_karma_number(month + day)
+        return numerology.soul_urge_number(month, day)
     
     @staticmethod
     def get_personality_number(day: int) -> int:
         """Personality Number based on birth day"""
-        return day % 9 if day % 9 != 0 else 9
+        return numerology.personality_number(day)
+    
+    @staticmethod
+    def get_name_numbers(name: str) -> Dict[str, int]:
+        """Expression, soul urge and personality numbers of a Latin or Thai name"""
+        return numerology.name_numbers(name)
     
     @staticmethod
     def get_chinese_element(year: int) -> Tuple[str, str]:
@@ -198,36 +279,44 @@ class AstrologicalCalculator:
         return year + 543
     
     @staticmethod
-    def get_biorhythm(day: int, month: int, year: int) -> Dict[str, float]:
-        """Calculate biorhythm cycles (0-100)"""
+    def get_biorhythm(day: int, month: int, year: int, as_of: Optional[datetime] = None) -> Dict[str, float]:
+        """Calculate biorhythm cycles (0-100) as of a moment (default: now)"""
         birth_date = datetime(year, month, day)
-        today = datetime.now()
-        days = (today - birth_date).days
-        
-        # Physical: 23-day cycle
-        physical = 50 + 50 * math.sin(2 * math.pi * days / 23)
-        # Emotional: 28-day cycle
-        emotional = 50 + 50 * math.sin(2 * math.pi * days / 28)
-        # Intellectual: 33-day cycle
-        intellectual = 50 + 50 * math.sin(2 * math.pi * days / 33)
-        
+        today = as_of or datetime.now()
+        return AstrologicalCalculator.get_biorhythm_for_days((today - birth_date).days)
+    
+    @staticmethod
+    def get_biorhythm_for_days(days: int) -> Dict[str, float]:
+        """Biorhythm cycles (0-100) for a number of days lived"""
         return {
-            "physical": round(physical, 1),
-            "emotional": round(emotional, 1),
-            "intellectual": round(intellectual, 1),
+            "physical": BIORHYTHM_PHASES["physical"][days % 23],
+            "emotional": BIORHYTHM_PHASES["emotional"][days % 28],
+            "intellectual": BIORHYTHM_PHASES["intellectual"][days % 33],
         }
     
+    @staticmethod
+    def get_biorhythm_range(birth_date: datetime, start: datetime, days: int) -> Dict[str, "np.ndarray"]:
+        """Biorhythm curves for ``days`` consecutive days beginning at start
+        
+        Returns a ``dates`` datetime64[D] array plus one float array per cycle.
+        """
+        result = AstrologicalCalculator.get_biorhythm_range_batch([birth_date], start, days)
+        return {name: values[0] if values.ndim == 2 else values for name, values in result.items()}
+    
+    @staticmethod
+    def get_biorhythm_range_batch(birth_dates, start: datetime, days: int) -> Dict[str, "np.ndarray"]:
+        """Biorhythm curves for many birth dates over one shared window
+        
+        Each cycle maps to an (n_birth_dates, days) array gathered from the phase
+        tables, so no trigonometry runs per point; ``dates`` holds the window.
+        """
+        from .vectorized import biorhythm_range_batch
+        return biorhythm_range_batch(birth_dates, start, days)
+    
     @staticmethod
     def get_penta_number(day: int) -> str:
         """Get Pentagonal number (Chaldean system)"""
-        pentagonal = (day * (3 * day - 1)) // 2
-        while pentagonal > 9:
-            s = 0
-            while pentagonal > 0:
-                s += pentagonal % 10
-                pentagonal //= 10
-            pentagonal = s
-        return str(pentagonal)
+        return str(numerology.penta_number(day))
     
     @staticmethod
     def get_lucky_direction(day: int) -> str:
@@ -236,34 +325,68 @@ class AstrologicalCalculator:
         return directions[day % 4]
     
     @staticmethod
-    def calculate_all(birth_date: datetime) -> Dict:
-        """Calculate all astrological data for a birth date"""
-        year = birth_date.year
-        month = birth_date.month
-        day = birth_date.day
+    def load_profile_index(path: Optional[str] = None) -> bool:
+        """Memory-map a prebuilt profile index for calculate_all lookups
         
-        chinese_animal_en, chinese_animal_th, chinese_element_en, chinese_element_th = \
-            AstrologicalCalculator.get_chinese_zodiac(year)
+        Returns False when the file does not exist, is truncated or was built by
+        another format version; calculate_all then keeps computing profiles directly.
+        """
+        global _PROFILE_INDEX
+        from .profile_index import DEFAULT_INDEX_PATH, ProfileIndex
         
-        western_sign_en, western_sign_th = AstrologicalCalculator.get_western_zodiac(month, day)
+        path = path or DEFAULT_INDEX_PATH
+        if _PROFILE_INDEX is not None and _PROFILE_INDEX.path == path:
+            return True
+        try:
+            _PROFILE_INDEX = ProfileIndex(path)
+        except (FileNotFoundError, ValueError):
+            return False
+        return True
+    
+    @staticmethod
+    def get_profile_codes(year: int, month: int, day: int) -> Tuple[int, ...]:
+        """Get the date-invariant profile as integer codes, ordered as PROFILE_CODE_FIELDS"""
+        if _PROFILE_INDEX is not None:
+            record = _PROFILE_INDEX.lookup(year, month, day)
+            if record is not None:
+                return record
         
-        moon_sign_en, moon_sign_th = AstrologicalCalculator.get_moon_sign(month, day)
+        slot = day_index(month, day)
+        karma = AstrologicalCalculator.get_karma_number(day)
+        return (
+            WESTERN_SIGN_BY_DAY[slot],
+            (year - 4) % 12,
+            (year - 4) % 10,
+            AstrologicalCalculator._moon_sign_index(year, month, day),
+            VEDIC_SIGN_BY_DAY[slot],
+            AstrologicalCalculator.get_life_path_number(day, month, year),
+            karma,
+            AstrologicalCalculator.get_soul_urge_number(month, day),
+            AstrologicalCalculator.get_personality_number(day),
+            int(AstrologicalCalculator.get_penta_number(day)),
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _static_profile(year: int, month: int, day: int) -> Dict:
+        """Memoized date-invariant profile; see calculate_static_profile"""
+        (western, animal, element, moon, vedic,
+         life_path, karma, soul_urge, personality, penta) = \
+            AstrologicalCalculator.get_profile_codes(year, month, day)
         
-        vedic_sign_en, vedic_sign_th, vedic_western = AstrologicalCalculator.get_vedic_sign(month, day)
+        chinese_animal_en, chinese_animal_th = CHINESE_ZODIAC_ANIMALS[animal]
+        chinese_element_en, chinese_element_th = CHINESE_ELEMENTS[element]
         
-        life_path = AstrologicalCalculator.get_life_path_number(day, month, year)
+        western_sign_en, western_sign_th = WESTERN_SIGNS[western]
         
-        karma = AstrologicalCalculator.get_karma_number(day)
-        soul_urge = AstrologicalCalculator.get_soul_urge_number(month, day)
-        personality = AstrologicalCalculator.get_personality_number(day)
+        moon_sign_en, moon_sign_th = MOON_SIGNS[moon]
         
-        biorhythm = AstrologicalCalculator.get_biorhythm(day, month, year)
+        vedic_sign_en, vedic_sign_th, vedic_western = VEDIC_SIGNS[vedic]
         
         buddhist_year = AstrologicalCalculator.get_buddhist_era(year)
         
         return {
-            "birth_date": birth_date.strftime("%Y-%m-%d"),
-            "age": (datetime.now() - birth_date).days // 365,
+            "birth_date": f"{year:04d}-{month:02d}-{day:02d}",
             "chinese_zodiac": {
                 "animal_en": chinese_animal_en,
                 "animal_th": chinese_animal_th,
@@ -289,8 +412,81 @@ class AstrologicalCalculator:
                 "karma_number": karma,
                 "soul_urge": soul_urge,
                 "personality": personality,
-                "penta_number": AstrologicalCalculator.get_penta_number(day),
+                "penta_number": str(penta),
             },
-            "biorhythm": biorhythm,
             "buddhist_era": buddhist_year,
         }
+    
+    @staticmethod
+    def calculate_static_profile(birth_date: datetime) -> Dict:
+        """Everything in calculate_all that never changes for a birth date
+        
+        Results are memoized and shared between callers, so treat them as read-only.
+        """
+        return AstrologicalCalculator._static_profile(birth_date.year, birth_date.month, birth_date.day)
+    
+    @staticmethod
+    def calculate_overlay(birth_date: datetime, as_of: Optional[datetime] = None) -> Dict:
+        """The time-varying part of calculate_all: age and biorhythm as of a moment"""
+        days = ((as_of or datetime.now()) - birth_date).days
+        return {
+            "age": days // 365,
+            "biorhythm": AstrologicalCalculator.get_biorhythm_for_days(days),
+        }
+    
+    @staticmethod
+    def calculate_all(birth_date: datetime, as_of: Optional[datetime] = None) -> Dict:
+        """Calculate all astrological data for a birth date
+        
+        Combines the memoized static profile with an overlay computed for as_of
+        (default: now, read once). Nested dicts come from the shared static
+        profile and must not be modified.
+        """
+        profile = AstrologicalCalculator.calculate_static_profile(birth_date)
+        overlay = AstrologicalCalculator.calculate_overlay(birth_date, as_of)
+        
+        return {
+            "birth_date": profile["birth_date"],
+            "age": overlay["age"],
+            "chinese_zodiac": profile["chinese_zodiac"],
+            "western_zodiac": profile["western_zodiac"],
+            "moon_sign": profile["moon_sign"],
+            "vedic_zodiac": profile["vedic_zodiac"],
+            "numerology": profile["numerology"],
+            "biorhythm": overlay["biorhythm"],
+            "buddhist_era": profile["buddhist_era"],
+        }
+    
+    @staticmethod
+    def calculate_batch(birth_dates, as_of: Optional[datetime] = None) -> Dict[str, "np.ndarray"]:
+        """Calculate astrological data for many birth dates as columnar arrays
+        
+        Accepts a NumPy datetime64 array, a pandas Series or any sequence of dates.
+        Sign columns hold integer codes that index the module tables:
+        ``western_sign`` -> WESTERN_SIGNS, ``chinese_animal`` -> CHINESE_ZODIAC_ANIMALS,
+        ``chinese_element`` -> CHINESE_ELEMENTS, ``moon_sign`` -> MOON_SIGNS and
+        ``vedic_sign`` -> VEDIC_SIGNS. Missing dates (NaT) raise ValueError.
+        NumPy is imported on first use.
+        """
+        from .vectorized import calculate_batch
+        return calculate_batch(birth_dates, as_of)
+    
+    @staticmethod
+    def get_name_numbers_batch(names: Iterable) -> Dict[str, "np.ndarray"]:
+        """get_name_numbers for a list, array or pandas Series of names, as columnar arrays"""
+        return numerology.name_numbers_batch(names)
+    
+    @staticmethod
+    def iter_profiles(
+        birth_dates: Iterable,
+        chunk_size: int = 10000,
+        as_of: Optional[datetime] = None
+    ) -> Iterator[Dict[str, "np.ndarray"]]:
+        """Lazily yield calculate_batch columns for each chunk of an iterable of dates
+        
+        Only one chunk is held at a time, so memory stays flat however long the
+        input is. The clock is read once up front so every chunk shares one as_of.
+        """
+        as_of = as_of or datetime.now()
+        for chunk in chunked(birth_dates, chunk_size):
+            yield AstrologicalCalculator.calculate_batch(chunk, as_of=as_of)
@@ -0,0 +1,135 @@
+"""
+Lunar Module
+Moon signs from a prebuilt table of lunar sign-ingress times, 1900-2100
+
+The table (data/moon_ingress.bin) holds the UTC minute at which the Moon
+enters each tropical sign. It is generated offline by core.moon_ingress and
+ships with the code.
+
+A lookup is a bisect over the packed array; nothing is computed per request.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+from typing import Optional, TYPE_CHECKING
+import functools
+import os
+import struct
+import sys
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# ============== File Layout ==============
+# Header: magic, format version, epoch date ordinal, ingress count, sign entered
+# at the first ingress; then one uint32 per ingress: UTC minutes since the epoch
+MAGIC = b"HMIN"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHIIB")
+
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "moon_ingress.bin"
+)
+# Minutes are unsigned, so the epoch sits before any table start
+EPOCH = date(1899, 12, 1)
+
+# Birth times are not collected, so a birth date is read at local noon in
+# Thai time (UTC+7), the app's home time zone
+BIRTH_UTC_OFFSET_MINUTES = 7 * 60
+BIRTH_LOCAL_MINUTE = 12 * 60
+
+_MINUTES_PER_DAY = 1440
+
+
+class IngressTable:
+    """Read-only view over a file written by core.moon_ingress.build_moon_table
+
+    ``minutes[i]`` is when the Moon enters sign ``(first_sign + i) % 12``;
+    the Moon never moves backwards through the zodiac, so signs need not be stored.
+    """
+
+    __slots__ = ("path", "epoch_ordinal", "first_sign", "minutes", "_bounds", "_count")
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.epoch_ordinal, count, self.first_sign = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or len(data) != HEADER.size + 4 * count:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} moon ingress table")
+        self.minutes = array("I")
+        self.minutes.frombytes(data[HEADER.size:])
+        if sys.byteorder == "big":
+            self.minutes.byteswap()
+        self._bounds = (self.minutes[0], self.minutes[-1])
+        self._count = count
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    @property
+    def start(self) -> datetime:
+        return self.moment(self.minutes[0])
+
+    @property
+    def end(self) -> datetime:
+        return self.moment(self.minutes[-1])
+
+    def moment(self, minute: int) -> datetime:
+        """UTC datetime of a minute offset"""
+        days, minute = divmod(minute, _MINUTES_PER_DAY)
+        day = date.fromordinal(self.epoch_ordinal + days)
+        return datetime(day.year, day.month, day.day, minute // 60, minute % 60, tzinfo=timezone.utc)
+
+    def sign_at_minute(self, minute: int) -> Optional[int]:
+        """MOON_SIGNS index at a UTC minute offset, or None outside the table"""
+        first, last = self._bounds
+        if not first <= minute < last:
+            return None
+        # Ingresses are nearly evenly spaced, so interpolation lands within a
+        # couple of entries; bisect that window, or everything if it misses
+        count = self._count
+        guess = (minute - first) * count // (last - first)
+        lo = guess - 2 if guess > 2 else 0
+        hi = guess + 4 if guess + 4 < count else count
+        i = bisect_right(self.minutes, minute, lo, hi)
+        if not lo < i < hi:
+            i = bisect_right(self.minutes, minute)
+        return (self.first_sign + i - 1) % 12
+
+
+@functools.lru_cache(maxsize=None)
+def ingress_table() -> IngressTable:
+    """The shipped table, loaded on first use"""
+    return IngressTable()
+
+
+def moon_sign_at(moment: datetime) -> Optional[int]:
+    """MOON_SIGNS index at a moment (naive datetimes are UTC), or None outside the table"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    table = ingress_table()
+    minute = (moment.toordinal() - table.epoch_ordinal) * _MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+    return table.sign_at_minute(minute)
+
+
+def moon_sign_on(year: int, month: int, day: int) -> Optional[int]:
+    """MOON_SIGNS index at local noon (UTC+7) on a birth date, or None outside the table"""
+    table = ingress_table()
+    minute = (date(year, month, day).toordinal() - table.epoch_ordinal) * _MINUTES_PER_DAY \
+        + BIRTH_LOCAL_MINUTE - BIRTH_UTC_OFFSET_MINUTES
+    return table.sign_at_minute(minute)
+
+
+def moon_sign_array(dates: "np.ndarray") -> "np.ndarray":
+    """moon_sign_on for a datetime64[D] array; -1 marks dates outside the table"""
+    import numpy as np
+
+    table = ingress_table()
+    minutes = np.frombuffer(table.minutes, dtype=np.uint32).astype(np.int64)
+    days = (dates - np.datetime64(date.fromordinal(table.epoch_ordinal), "D")).astype(np.int64)
+    at = days * _MINUTES_PER_DAY + (BIRTH_LOCAL_MINUTE - BIRTH_UTC_OFFSET_MINUTES)
+    i = np.searchsorted(minutes, at, side="right")
+    return np.where((i > 0) & (i < len(minutes)), (table.first_sign + i - 1) % 12, -1)
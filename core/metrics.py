@@ -0,0 +1,241 @@
+"""
+Metrics Module
+Opt-in hot-path instrumentation with a Prometheus text-format export
+
+Enable with HOROSCOPE_METRICS=1 in the environment, or call enable() at runtime.
+When disabled the hot-path functions are left completely unwrapped, so
+instrumentation costs nothing. Snapshots can be written to a file
+(write_snapshot) or served on a local port (serve, or HOROSCOPE_METRICS_PORT).
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+import functools
+import inspect
+import os
+import threading
+import time
+
+from . import predictors
+from .cache import prediction_cache
+from .calculators import AstrologicalCalculator
+from .predictors import PredictionGenerator
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# Owner, attribute name and the metric label it is reported under
+INSTRUMENTED: List[Tuple[object, str, str]] = [
+    (AstrologicalCalculator, "calculate_all", "calculate_all"),
+    (AstrologicalCalculator, "calculate_static_profile", "calculate_static_profile"),
+    (AstrologicalCalculator, "calculate_overlay", "calculate_overlay"),
+    (AstrologicalCalculator, "calculate_batch", "calculate_batch"),
+    (AstrologicalCalculator, "get_profile_codes", "get_profile_codes"),
+    (AstrologicalCalculator, "get_biorhythm_range_batch", "get_biorhythm_range_batch"),
+    (AstrologicalCalculator, "get_name_numbers_batch", "get_name_numbers_batch"),
+    (PredictionGenerator, "_get_seed", "get_seed"),
+    (PredictionGenerator, "_get_category_indices", "category_indices"),
+    (PredictionGenerator, "_get_template_indices", "sample_templates"),
+    (PredictionGenerator, "generate_daily_prediction", "generate_daily_prediction"),
+    (PredictionGenerator, "generate_weekly_forecast", "generate_weekly_forecast"),
+    (PredictionGenerator, "generate_monthly_outlook", "generate_monthly_outlook"),
+    (PredictionGenerator, "generate_prediction_codes", "generate_prediction_codes"),
+    (PredictionGenerator, "generate_batch", "generate_batch"),
+    (PredictionGenerator, "generate_calendar", "generate_calendar"),
+    (PredictionGenerator, "get_lucky_elements", "get_lucky_elements"),
+    (predictors, "_md5_seed", "md5_seed"),
+    (predictors, "_table_indices", "table_indices"),
+]
+
+QUANTILES = (0.5, 0.9, 0.99)
+SAMPLE_WINDOW = 2048
+
+
+class FunctionStats:
+    """Call count, cumulative time and a sliding window of recent durations"""
+
+    __slots__ = ("calls", "total_seconds", "samples", "lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self.lock:
+            self.calls += 1
+            self.total_seconds += seconds
+            self.samples.append(seconds)
+
+    def quantiles(self) -> Dict[float, float]:
+        with self.lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return {q: 0.0 for q in QUANTILES}
+        return {q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in QUANTILES}
+
+
+_stats: Dict[str, FunctionStats] = {}
+_originals: Dict[Tuple[int, str], object] = {}
+_enabled = False
+_server: Optional["ThreadingHTTPServer"] = None
+
+
+def _stats_for(label: str) -> FunctionStats:
+    stats = _stats.get(label)
+    if stats is None:
+        stats = _stats.setdefault(label, FunctionStats())
+    return stats
+
+
+def _timed(func: Callable, label: str) -> Callable:
+    stats = _stats_for(label)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(time.perf_counter() - started)
+
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    """Wrap every INSTRUMENTED function with a timer"""
+    global _enabled
+    if _enabled:
+        return
+    for owner, name, label in INSTRUMENTED:
+        raw = inspect.getattr_static(owner, name)
+        _originals[(id(owner), name)] = raw
+        if isinstance(raw, staticmethod):
+            setattr(owner, name, staticmethod(_timed(raw.__func__, label)))
+        elif isinstance(raw, classmethod):
+            setattr(owner, name, classmethod(_timed(raw.__func__, label)))
+        else:
+            setattr(owner, name, _timed(raw, label))
+    _enabled = True
+
+
+def disable() -> None:
+    """Restore the original, unwrapped functions"""
+    global _enabled
+    if not _enabled:
+        return
+    for owner, name, _ in INSTRUMENTED:
+        setattr(owner, name, _originals.pop((id(owner), name)))
+    _enabled = False
+
+
+def reset() -> None:
+    """Clear every recorded call; cache counters are owned by the caches"""
+    for stats in _stats.values():
+        with stats.lock:
+            stats.calls = 0
+            stats.total_seconds = 0.0
+            stats.samples.clear()
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """Time a block, such as a page render, when metrics are enabled"""
+    if not _enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _stats_for(label).record(time.perf_counter() - started)
+
+
+def _cache_counters() -> Dict[str, Tuple[int, int]]:
+    """(hits, misses) for each cache in core"""
+    profile_info = AstrologicalCalculator._static_profile.cache_info()
+    prediction_stats = prediction_cache.stats()
+    return {
+        "static_profile": (profile_info.hits, profile_info.misses),
+        "prediction": (prediction_stats["hits"], prediction_stats["misses"]),
+    }
+
+
+def render_prometheus() -> str:
+    """Current metrics in Prometheus text exposition format"""
+    lines = [
+        "# HELP horoscope_call_duration_seconds Latency of instrumented core functions.",
+        "# TYPE horoscope_call_duration_seconds summary",
+    ]
+    for label in sorted(_stats):
+        stats = _stats[label]
+        for q, value in stats.quantiles().items():
+            lines.append(f'horoscope_call_duration_seconds{{function="{label}",quantile="{q}"}} {value:.9f}')
+        lines.append(f'horoscope_call_duration_seconds_sum{{function="{label}"}} {stats.total_seconds:.9f}')
+        lines.append(f'horoscope_call_duration_seconds_count{{function="{label}"}} {stats.calls}')
+
+    counters = _cache_counters()
+    lines += [
+        "# HELP horoscope_cache_hits_total Cache lookups answered from memory.",
+        "# TYPE horoscope_cache_hits_total counter",
+    ]
+    lines += [f'horoscope_cache_hits_total{{cache="{name}"}} {hits}' for name, (hits, _) in counters.items()]
+    lines += [
+        "# HELP horoscope_cache_misses_total Cache lookups that had to compute.",
+        "# TYPE horoscope_cache_misses_total counter",
+    ]
+    lines += [f'horoscope_cache_misses_total{{cache="{name}"}} {misses}' for name, (_, misses) in counters.items()]
+    lines += [
+        "# HELP horoscope_cache_hit_ratio Share of cache lookups answered from memory.",
+        "# TYPE horoscope_cache_hit_ratio gauge",
+    ]
+    for name, (hits, misses) in counters.items():
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        lines.append(f'horoscope_cache_hit_ratio{{cache="{name}"}} {ratio:.4f}')
+    return "\n".join(lines) + "\n"
+
+
+def write_snapshot(path: str) -> None:
+    """Atomically write the current snapshot, e.g. for a node-exporter textfile collector"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def serve(port: int = 9108, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """Serve the snapshot over HTTP from a daemon thread; idempotent per process"""
+    global _server
+    if _server is not None:
+        return _server
+
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    _server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=_server.serve_forever, name="horoscope-metrics", daemon=True).start()
+    return _server
+
+
+if os.environ.get("HOROSCOPE_METRICS") == "1":
+    enable()
+    if os.environ.get("HOROSCOPE_METRICS_PORT"):
+        serve(int(os.environ["HOROSCOPE_METRICS_PORT"]))
@@ -0,0 +1,244 @@
+"""
+Moon Ingress Table Builder
+Generates and validates data/moon_ingress.bin, the table behind core.lunar
+
+Moon positions come from the ELP-2000/82 lunar theory as truncated in Meeus,
+Astronomical Algorithms, ch. 47: about 10" in longitude, well under a minute
+of ingress time. Run from the repository root:
+    python -m core.moon_ingress build
+    python -m core.moon_ingress verify
+"""
+
+from datetime import date, datetime
+from typing import List, Tuple
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from .lunar import DEFAULT_TABLE_PATH, EPOCH, FORMAT_VERSION, HEADER, MAGIC, IngressTable
+
+
+# Covers 1900-2100 in every time zone
+DEFAULT_START = date(1899, 12, 25)
+DEFAULT_END = date(2101, 1, 7)
+
+_MINUTES_PER_DAY = 1440
+# Julian day of EPOCH at 0h UT
+_EPOCH_JD = EPOCH.toordinal() + 1721424.5
+
+
+# ============== Generator ==============
+# Meeus table 47.A: multiples of D, M, M', F and the sine coefficient of the
+# longitude in 1e-6 degrees
+_LONGITUDE_TERMS = (
+    (0, 0, 1, 0, 6288774), (2, 0, -1, 0, 1274027), (2, 0, 0, 0, 658314), (0, 0, 2, 0, 213618),
+    (0, 1, 0, 0, -185116), (0, 0, 0, 2, -114332), (2, 0, -2, 0, 58793), (2, -1, -1, 0, 57066),
+    (2, 0, 1, 0, 53322), (2, -1, 0, 0, 45758), (0, 1, -1, 0, -40923), (1, 0, 0, 0, -34720),
+    (0, 1, 1, 0, -30383), (2, 0, 0, -2, 15327), (0, 0, 1, 2, -12528), (0, 0, 1, -2, 10980),
+    (4, 0, -1, 0, 10675), (0, 0, 3, 0, 10034), (4, 0, -2, 0, 8548), (2, 1, -1, 0, -7888),
+    (2, 1, 0, 0, -6766), (1, 0, -1, 0, -5163), (1, 1, 0, 0, 4987), (2, -1, 1, 0, 4036),
+    (2, 0, 2, 0, 3994), (4, 0, 0, 0, 3861), (2, 0, -3, 0, 3665), (0, 1, -2, 0, -2689),
+    (2, 0, -1, 2, -2602), (2, -1, -2, 0, 2390), (1, 0, 1, 0, -2348), (2, -2, 0, 0, 2236),
+    (0, 1, 2, 0, -2120), (0, 2, 0, 0, -2069), (2, -2, -1, 0, 2048), (2, 0, 1, -2, -1773),
+    (2, 0, 0, 2, -1595), (4, -1, -1, 0, 1215), (0, 0, 2, 2, -1110), (3, 0, -1, 0, -892),
+    (2, 1, 1, 0, -810), (4, -1, -2, 0, 759), (0, 2, -1, 0, -713), (2, 2, -1, 0, -700),
+    (2, 1, -2, 0, 691), (2, -1, 0, -2, 596), (4, 0, 1, 0, 549), (0, 0, 4, 0, 537),
+    (4, -1, 0, 0, 520), (1, 0, -2, 0, -487), (2, 1, 0, -2, -399), (0, 0, 2, -2, -381),
+    (1, 1, 1, 0, 351), (3, 0, -2, 0, -340), (4, 0, -3, 0, 330), (2, -1, 2, 0, 327),
+    (0, 2, 1, 0, -323), (1, 1, -1, 0, 299), (0, 0, 3, -2, 294),
+)
+
+
+def delta_t_seconds(year: np.ndarray) -> np.ndarray:
+    """TT - UT in seconds for decimal years 1900-2150 (Espenak and Meeus polynomials)"""
+    y = np.asarray(year, dtype=float)
+    pieces = [
+        (y < 1920, lambda t: -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4, 1900),
+        (y < 1941, lambda t: 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3, 1920),
+        (y < 1961, lambda t: 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547, 1950),
+        (y < 1986, lambda t: 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718, 1975),
+        (y < 2005, lambda t: 63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3
+         + 0.000651814 * t**4 + 0.00002373599 * t**5, 2000),
+        (y < 2050, lambda t: 62.92 + 0.32217 * t + 0.005589 * t**2, 2000),
+    ]
+    result = -20 + 32 * ((y - 1820) / 100) ** 2 - 0.5628 * (2150 - y)
+    for mask, poly, base in reversed(pieces):
+        result = np.where(mask, poly(y - base), result)
+    return result
+
+
+def moon_longitude(jde: np.ndarray) -> np.ndarray:
+    """Apparent geocentric ecliptic longitude of the Moon in degrees, for Julian Ephemeris Days"""
+    T = (np.asarray(jde, dtype=float) - 2451545.0) / 36525
+    Lp = 218.3164477 + 481267.88123421 * T - 0.0015786 * T**2 + T**3 / 538841 - T**4 / 65194000
+    D = 297.8501921 + 445267.1114034 * T - 0.0018819 * T**2 + T**3 / 545868 - T**4 / 113065000
+    M = 357.5291092 + 35999.0502909 * T - 0.0001536 * T**2 + T**3 / 24490000
+    Mp = 134.9633964 + 477198.8675055 * T + 0.0087414 * T**2 + T**3 / 69699 - T**4 / 14712000
+    F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T**2 - T**3 / 3526000 + T**4 / 863310000
+    E = 1 - 0.002516 * T - 0.0000074 * T**2
+    D, M, Mp, F = (np.radians(angle % 360) for angle in (D, M, Mp, F))
+
+    sigma = np.zeros_like(T)
+    for d, m, mp, f, coefficient in _LONGITUDE_TERMS:
+        # Terms in M shrink with the Earth's decreasing orbital eccentricity
+        sigma += coefficient * E ** abs(m) * np.sin(d * D + m * M + mp * Mp + f * F)
+    A1 = np.radians(119.75 + 131.849 * T)
+    A2 = np.radians(53.09 + 479264.290 * T)
+    sigma += 3958 * np.sin(A1) + 1962 * np.sin(np.radians(Lp) - F) + 318 * np.sin(A2)
+
+    # Nutation in longitude, to 0.5" (Meeus ch. 22)
+    omega = np.radians(125.04452 - 1934.136261 * T)
+    L = np.radians(280.4665 + 36000.7698 * T)
+    nutation = (-17.20 * np.sin(omega) - 1.32 * np.sin(2 * L) - 0.23 * np.sin(2 * np.radians(Lp))
+                + 0.21 * np.sin(2 * omega)) / 3600
+    return (Lp + sigma / 1e6 + nutation) % 360
+
+
+def _minutes_to_jde(minutes: np.ndarray) -> np.ndarray:
+    jd = _EPOCH_JD + minutes / _MINUTES_PER_DAY
+    return jd + delta_t_seconds(2000 + (jd - 2451545.0) / 365.25) / 86400
+
+
+def compute_ingresses(start: date = DEFAULT_START, end: date = DEFAULT_END) -> Tuple[int, np.ndarray]:
+    """Sign entered at the first ingress in [start, end) and every ingress as minutes since EPOCH
+
+    Scans the Moon every 6 hours (about 3 degrees, far below one sign), then
+    bisects each bracketing interval to under a second.
+    """
+    if start < EPOCH:
+        raise ValueError(f"tables cannot start before {EPOCH}")
+    first = (start - EPOCH).days * _MINUTES_PER_DAY
+    last = (end - EPOCH).days * _MINUTES_PER_DAY
+    grid = np.arange(first, last + 1, 360, dtype=float)
+    signs = (moon_longitude(_minutes_to_jde(grid)) // 30).astype(np.int64)
+    crossing = np.flatnonzero(signs[1:] != signs[:-1])
+
+    low, high = grid[crossing], grid[crossing + 1]
+    boundary = signs[crossing + 1] * 30.0
+    for _ in range(20):
+        middle = (low + high) / 2
+        # Signed distance past the boundary, in (-180, 180]
+        past = (moon_longitude(_minutes_to_jde(middle)) - boundary + 180) % 360 - 180 >= 0
+        high = np.where(past, middle, high)
+        low = np.where(past, low, middle)
+
+    entered = signs[crossing + 1]
+    if np.any((entered[1:] - entered[:-1]) % 12 != 1):
+        raise ValueError("the Moon skipped or repeated a sign; the scan step is too coarse")
+    return int(entered[0]), np.round(high).astype(np.uint32)
+
+
+def build_moon_table(path: str = DEFAULT_TABLE_PATH, start: date = DEFAULT_START, end: date = DEFAULT_END) -> int:
+    """Write the ingress table for [start, end) and return the ingress count"""
+    first_sign, minutes = compute_ingresses(start, end)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, EPOCH.toordinal(), len(minutes), first_sign))
+        f.write(minutes.astype("<u4").tobytes())
+    os.replace(tmp_path, path)
+    return len(minutes)
+
+
+# ============== Validation ==============
+# Meeus example 47.a: apparent longitude at JDE 2448724.5 (1992 April 12, 0h TD)
+REFERENCE_LONGITUDES = ((2448724.5, 133.167265),)
+
+# Published instants (UTC) of new (0) and full (180) moons, spread over the table
+REFERENCE_LUNATIONS = (
+    (datetime(1977, 2, 18, 3, 37), 0),     # Meeus example 49.a, 3h37m42s TD
+    (datetime(1999, 8, 11, 11, 8), 0),
+    (datetime(2000, 1, 6, 18, 14), 0),
+    (datetime(2000, 1, 21, 4, 40), 180),
+    (datetime(2001, 1, 9, 20, 24), 180),
+    (datetime(2012, 5, 20, 23, 47), 0),
+    (datetime(2017, 8, 21, 18, 30), 0),
+    (datetime(2018, 7, 27, 20, 20), 180),
+    (datetime(2019, 7, 2, 19, 16), 0),
+    (datetime(2024, 4, 8, 18, 21), 0),
+)
+
+
+def sun_longitude(jde: np.ndarray) -> np.ndarray:
+    """Apparent longitude of the Sun in degrees, to 0.01 (Meeus ch. 25); used only to validate"""
+    T = (np.asarray(jde, dtype=float) - 2451545.0) / 36525
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T**2
+    M = np.radians(357.52911 + 35999.05029 * T - 0.0001537 * T**2)
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T**2) * np.sin(M)
+         + (0.019993 - 0.000101 * T) * np.sin(2 * M) + 0.000289 * np.sin(3 * M))
+    omega = np.radians(125.04 - 1934.136 * T)
+    return (L0 + C - 0.00569 - 0.00478 * np.sin(omega)) % 360
+
+
+def verify_moon_table(table: IngressTable, sample: int = 2000) -> List[str]:
+    """Problems found in the table and the model behind it; an empty list means both are sound
+
+    Checks the model against the reference longitudes and lunations, the table's
+    ingress spacing, and ``sample`` random instants against the model.
+    """
+    problems = []
+    for jde, expected in REFERENCE_LONGITUDES:
+        got = float(moon_longitude(jde))
+        if abs(got - expected) > 0.001:
+            problems.append(f"longitude at JDE {jde}: {got:.6f}, expected {expected:.6f}")
+
+    for moment, elongation in REFERENCE_LUNATIONS:
+        minute = (moment - datetime(EPOCH.year, EPOCH.month, EPOCH.day)).total_seconds() / 60
+        jde = _minutes_to_jde(np.float64(minute))
+        # The Moon gains 0.02 degree on the Sun in about 2 minutes
+        off = (float(moon_longitude(jde) - sun_longitude(jde)) - elongation + 180) % 360 - 180
+        if abs(off) > 0.02:
+            problems.append(f"{'new' if elongation == 0 else 'full'} moon {moment}: off by {off:.3f} degrees")
+
+    minutes = np.frombuffer(table.minutes, dtype=np.uint32).astype(np.int64)
+    gaps = np.diff(minutes) / _MINUTES_PER_DAY
+    if np.any(gaps < 1.8) or np.any(gaps > 3.0):
+        problems.append(f"ingress gaps span {gaps.min():.2f}-{gaps.max():.2f} days, expected about 2.0-2.8")
+
+    rng = np.random.default_rng(0)
+    instants = rng.integers(minutes[0], minutes[-1], sample)
+    # Skip instants within two minutes of an ingress, where rounding decides
+    i = np.searchsorted(minutes, instants, side="right")
+    clear = (instants - minutes[i - 1] >= 2) & (minutes[np.minimum(i, len(minutes) - 1)] - instants >= 2)
+    modelled = (moon_longitude(_minutes_to_jde(instants[clear].astype(float))) // 30).astype(np.int64)
+    stored = (table.first_sign + i[clear] - 1) % 12
+    mismatches = int(np.count_nonzero(modelled != stored))
+    if mismatches:
+        problems.append(f"{mismatches} of {int(clear.sum())} sampled instants disagree with the model")
+    return problems
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; verify returns 1 when the table has problems"""
+    parser = argparse.ArgumentParser(description="Build or verify the moon sign ingress table")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="compute and write the table")
+    build.add_argument("--start", default=DEFAULT_START.isoformat(), help="first date (YYYY-MM-DD)")
+    build.add_argument("--end", default=DEFAULT_END.isoformat(), help="end date, exclusive (YYYY-MM-DD)")
+    verify = subparsers.add_parser("verify", help="check the model and the table against reference values")
+    verify.add_argument("--sample", type=int, default=2000)
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("--path", default=DEFAULT_TABLE_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == "verify":
+        table = IngressTable(args.path)
+        problems = verify_moon_table(table, args.sample)
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        if not problems:
+            print(f"OK: {len(table)} ingresses, {table.start:%Y-%m-%d %H:%M} to {table.end:%Y-%m-%d %H:%M} UTC")
+        return 1 if problems else 0
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").date()
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+    count = build_moon_table(args.path, start, end)
+    print(f"Wrote {count} ingresses ({os.path.getsize(args.path) / 1024:.0f} KiB) to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+Numerology Module
+Table-driven digit reduction shared by the scalar and vectorized calculators
+
+Every date function takes an int or a NumPy integer array and returns the
+same kind. Reduction keeps the master numbers 11 and 22 exactly as the
+original repeated digit-sum loops did.
+
+Name numbers (expression, soul urge, personality) score Latin and Thai names
+with translation tables compiled on first use: a name is encoded to a
+single-byte code page and its bytes are translated to letter values.
+"""
+
+from typing import Dict, Iterable, Tuple, TYPE_CHECKING, Union
+import codecs
+import functools
+import re
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    IntOrArray = Union[int, np.ndarray]
+
+
+MASTER_NUMBERS = (11, 22)
+
+# Digit sum of every two-digit chunk; a number >= 100 is never a master
+# number, so reducing it always starts with one plain digit-sum step
+_DIGIT_SUMS = tuple(n // 10 + n % 10 for n in range(100))
+
+
+def _build_reduced(keep_master: bool) -> tuple:
+    table = []
+    for n in range(100):
+        while n > 9 and not (keep_master and n in MASTER_NUMBERS):
+            n = _DIGIT_SUMS[n]
+        table.append(n)
+    return tuple(table)
+
+
+# n -> fully reduced n for 0 <= n < 100, with and without master numbers
+_REDUCED_MASTER = _build_reduced(True)
+_REDUCED_PLAIN = _build_reduced(False)
+
+
+def _is_scalar(n) -> bool:
+    # NumPy integer scalars have ndim 0; checking the attribute avoids importing numbers
+    return isinstance(n, int) or getattr(n, "ndim", None) == 0
+
+
+def _reduce_int(n: int, table: tuple) -> int:
+    if 0 <= n < 100:
+        return table[n]
+    if 100 <= n < 10000:
+        return table[_DIGIT_SUMS[n // 100] + _DIGIT_SUMS[n % 100]]
+    if n < 0:
+        return n
+    while n >= 100:
+        total = 0
+        while n:
+            total += _DIGIT_SUMS[n % 100]
+            n //= 100
+        n = total
+    return table[n]
+
+
+def digit_sum(n: "IntOrArray") -> "IntOrArray":
+    """Sum of the decimal digits of a non-negative number"""
+    if _is_scalar(n):
+        n = int(n)
+        total = 0
+        while n:
+            total += _DIGIT_SUMS[n % 100]
+            n //= 100
+        return total
+
+    import numpy as np
+
+    rest = np.array(n, dtype=np.int64)
+    total = np.zeros_like(rest)
+    sums = np.array(_DIGIT_SUMS, dtype=np.int64)
+    while rest.any():
+        total += sums[rest % 100]
+        rest //= 100
+    return total
+
+
+def reduce_number(n: "IntOrArray", keep_master: bool = True) -> "IntOrArray":
+    """Repeated digit sum down to one digit, stopping at 11 and 22 when keep_master
+
+    Negative numbers are returned unchanged, as the original loops did.
+    """
+    table = _REDUCED_MASTER if keep_master else _REDUCED_PLAIN
+    if _is_scalar(n):
+        return _reduce_int(n, table)
+
+    import numpy as np
+
+    values = np.array(n, dtype=np.int64)
+    lookup = np.array(table, dtype=np.int64)
+    sums = np.array(_DIGIT_SUMS, dtype=np.int64)
+    # Dates never leave [0, 10000): one digit-sum lookup lands every value in the table
+    if values.size == 0 or values.min() >= 0 and values.max() < 10000:
+        if values.size == 0 or values.max() < 100:
+            return lookup[values]
+        return lookup[np.where(values < 100, values, sums[values // 100] + sums[values % 100])]
+
+    large = values >= 10000
+    while large.any():
+        values[large] = digit_sum(values[large])
+        large = values >= 10000
+    below = np.clip(values, 0, None)
+    below = np.where(below < 100, below, sums[below // 100] + sums[below % 100])
+    return np.where(values >= 0, lookup[below], values)
+
+
+def mod_nine(n: "IntOrArray") -> "IntOrArray":
+    """n mod 9, with 9 in place of 0"""
+    if _is_scalar(n):
+        return n % 9 or 9
+
+    import numpy as np
+
+    result = np.asarray(n, dtype=np.int64) % 9
+    result[result == 0] = 9
+    return result
+
+
+def life_path_number(day: "IntOrArray", month: "IntOrArray", year: "IntOrArray") -> "IntOrArray":
+    """Pythagorean life path: reduce day, month and year, then reduce their sum"""
+    if _is_scalar(day) and _is_scalar(month) and _is_scalar(year):
+        table = _REDUCED_MASTER
+        return _reduce_int(_reduce_int(day, table) + _reduce_int(month, table) + _reduce_int(year, table), table)
+    return reduce_number(reduce_number(day) + reduce_number(month) + reduce_number(year))
+
+
+def karma_number(day: "IntOrArray") -> "IntOrArray":
+    return mod_nine(day)
+
+
+def soul_urge_number(month: "IntOrArray", day: "IntOrArray") -> "IntOrArray":
+    return mod_nine(month + day)
+
+
+def personality_number(day: "IntOrArray") -> "IntOrArray":
+    return mod_nine(day)
+
+
+def penta_number(day: "IntOrArray") -> "IntOrArray":
+    """Digit-reduced pentagonal number of the day, without master numbers"""
+    if _is_scalar(day):
+        return _reduce_int(day * (3 * day - 1) // 2, _REDUCED_PLAIN)
+    return reduce_number(day * (3 * day - 1) // 2, keep_master=False)
+
+
+# ============== Names ==============
+PYTHAGOREAN_VALUES = {letter: i % 9 + 1 for i, letter in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}
+VOWELS = frozenset("AEIOU")
+
+# Character-level RTGS romanization with initial-consonant values. Letter sums
+# ignore order, so leading vowels (เ แ โ ใ ไ) need no reordering; tone marks,
+# unwritten vowels and final-consonant changes are not represented.
+THAI_TRANSLITERATION = {
+    "ก": "k", "ข": "kh", "ฃ": "kh", "ค": "kh", "ฅ": "kh", "ฆ": "kh", "ง": "ng",
+    "จ": "ch", "ฉ": "ch", "ช": "ch", "ซ": "s", "ฌ": "ch", "ญ": "y",
+    "ฎ": "d", "ฏ": "t", "ฐ": "th", "ฑ": "th", "ฒ": "th", "ณ": "n",
+    "ด": "d", "ต": "t", "ถ": "th", "ท": "th", "ธ": "th", "น": "n",
+    "บ": "b", "ป": "p", "ผ": "ph", "ฝ": "f", "พ": "ph", "ฟ": "f", "ภ": "ph", "ม": "m",
+    "ย": "y", "ร": "r", "ฤ": "rue", "ล": "l", "ฦ": "lue", "ว": "w",
+    "ศ": "s", "ษ": "s", "ส": "s", "ห": "h", "ฬ": "l", "อ": "", "ฮ": "h",
+    "ะ": "a", "ั": "a", "า": "a", "ำ": "am", "ิ": "i", "ี": "i", "ึ": "ue", "ื": "ue",
+    "ุ": "u", "ู": "u", "เ": "e", "แ": "ae", "โ": "o", "ใ": "ai", "ไ": "ai",
+    "ๅ": "", "ฺ": "", "็": "", "่": "", "้": "", "๊": "", "๋": "", "์": "", "ํ": "", "๎": "",
+    "ๆ": "", "ฯ": "",
+    **{chr(0x0E50 + digit): "" for digit in range(10)},
+}
+
+# A consonant carrying the thanthakhat (์) is silent, with any vowel or tone mark on it
+_THAI_CONSONANT = "[\u0e01-\u0e2e]"
+_THAI_MARK = "[\u0e31\u0e34-\u0e3a\u0e47-\u0e4b]"
+_THANTHAKHAT = "\u0e4c"
+_SILENT_THAI = f"{_THAI_CONSONANT}{_THAI_MARK}?{_THANTHAKHAT}"
+# Byte classes used to silence the same letters in encoded batches
+_CONSONANT_BYTE, _MARK_BYTE, _THANTHAKHAT_BYTE = 1, 2, 3
+# Characters outside the name code page go through this error handler, which
+# spells accented Latin letters as their base letters and replaces everything
+# else with _UNSCORED, a zero-value placeholder that keeps letters apart
+_FOLD_ERRORS = "numerology.fold"
+_UNSCORED = "\ufffd"
+
+
+class _NameTables:
+    """Translation tables for name scoring, compiled once by _name_tables()
+
+    Names are encoded to a private single-byte code page holding ASCII, the
+    Thai letters and marks, _UNSCORED and the accented letters of Latin-1.
+    ``values`` and ``vowel_values`` map each byte to the letter and vowel
+    values of its character (for Thai, of its romanization), and ``classes``
+    marks Thai consonants, vowel/tone marks and the thanthakhat.
+    """
+
+    __slots__ = ("thai", "silent", "folded", "encoding_table", "values", "vowel_values", "classes")
+
+    def __init__(self):
+        import unicodedata
+
+        self.thai = str.maketrans(THAI_TRANSLITERATION)
+        self.silent = re.compile(_SILENT_THAI)
+        self.folded = {}
+        # Latin-1 Supplement through Latin Extended-B
+        for c in range(0xC0, 0x250):
+            letters = "".join(ch for ch in unicodedata.normalize("NFKD", chr(c)).upper() if ch in PYTHAGOREAN_VALUES)
+            if letters:
+                self.folded[chr(c)] = letters
+
+        charset = [chr(c) for c in range(128)]
+        charset += [ch for ch in THAI_TRANSLITERATION if not "\u0e50" <= ch <= "\u0e59"]
+        charset.append(_UNSCORED)
+        # Folds are in code point order, so all of Latin-1 fits; the rest use _FOLD_ERRORS
+        charset += list(self.folded)[:256 - len(charset)]
+        self.encoding_table = codecs.charmap_build("".join(charset).ljust(256, "\ufffe"))
+
+        values = bytearray(256)
+        vowel_values = bytearray(256)
+        classes = bytearray(256)
+        for byte, char in enumerate(charset):
+            if char in THAI_TRANSLITERATION:
+                letters = THAI_TRANSLITERATION[char].upper()
+            else:
+                letters = self.folded.get(char) or (char.upper() if char.upper() in PYTHAGOREAN_VALUES else "")
+            for letter in letters:
+                values[byte] += PYTHAGOREAN_VALUES[letter]
+                if letter in VOWELS:
+                    vowel_values[byte] += PYTHAGOREAN_VALUES[letter]
+            for code, pattern in ((_CONSONANT_BYTE, _THAI_CONSONANT), (_MARK_BYTE, _THAI_MARK),
+                                  (_THANTHAKHAT_BYTE, _THANTHAKHAT)):
+                if re.fullmatch(pattern, char):
+                    classes[byte] = code
+        self.values = bytes(values)
+        self.vowel_values = bytes(vowel_values)
+        self.classes = bytes(classes)
+
+
+@functools.lru_cache(maxsize=None)
+def _name_tables() -> _NameTables:
+    tables = _NameTables()
+    codecs.register_error(_FOLD_ERRORS, _fold_latin)
+    return tables
+
+
+def _fold_latin(error: UnicodeEncodeError) -> Tuple[str, int]:
+    folded = _name_tables().folded
+    return "".join(folded.get(ch, _UNSCORED) for ch in error.object[error.start:error.end]), error.end
+
+
+def transliterate_thai(name: str) -> str:
+    """Romanize the Thai characters of a name; other characters pass through"""
+    tables = _name_tables()
+    return tables.silent.sub("", name).translate(tables.thai)
+
+
+def _name_bytes(name: str, tables: _NameTables) -> bytes:
+    """The name in the name code page, with silent Thai letters removed"""
+    if _THANTHAKHAT in name:
+        name = tables.silent.sub("", name)
+    return codecs.charmap_encode(name, _FOLD_ERRORS, tables.encoding_table)[0]
+
+
+def expression_number(name: str) -> int:
+    """Destiny (expression) number: every letter of the full name; 0 for no letters"""
+    tables = _name_tables()
+    return _reduce_int(sum(_name_bytes(name, tables).translate(tables.values)), _REDUCED_MASTER)
+
+
+def name_soul_urge_number(name: str) -> int:
+    """Soul urge (heart's desire) number: the vowels of the name"""
+    tables = _name_tables()
+    return _reduce_int(sum(_name_bytes(name, tables).translate(tables.vowel_values)), _REDUCED_MASTER)
+
+
+def name_personality_number(name: str) -> int:
+    """Personality number: the consonants of the name"""
+    return name_numbers(name)["personality"]
+
+
+def name_numbers(name: str) -> Dict[str, int]:
+    """Expression, soul urge and personality numbers of one name"""
+    tables = _name_tables()
+    encoded = _name_bytes(name, tables)
+    total = sum(encoded.translate(tables.values))
+    vowels = sum(encoded.translate(tables.vowel_values))
+    return {
+        "expression": _reduce_int(total, _REDUCED_MASTER),
+        "soul_urge": _reduce_int(vowels, _REDUCED_MASTER),
+        "personality": _reduce_int(total - vowels, _REDUCED_MASTER),
+    }
+
+
+def _segment_sums(scores: "np.ndarray", stops: "np.ndarray") -> "np.ndarray":
+    """Sum of scores between consecutive stops, from running totals"""
+    import numpy as np
+
+    running = np.concatenate(([0], np.cumsum(scores, dtype=np.int64)))
+    return np.diff(running[stops], prepend=0)
+
+
+def _silent_positions(classes: "np.ndarray") -> "np.ndarray":
+    """Byte positions _SILENT_THAI would remove, given each byte's class"""
+    import numpy as np
+
+    before = np.flatnonzero(classes == _THANTHAKHAT_BYTE)
+    before = before[before >= 1] - 1
+    consonants = before[classes[before] == _CONSONANT_BYTE]
+    marks = before[(classes[before] == _MARK_BYTE) & (before >= 1)]
+    marks = marks[classes[marks - 1] == _CONSONANT_BYTE]
+    return np.concatenate((consonants, marks, marks - 1))
+
+
+def name_numbers_batch(names: Iterable) -> Dict[str, "np.ndarray"]:
+    """name_numbers for a list, array or pandas Series of names, as int64 columns
+
+    All names are joined and encoded in one call, then scored and summed per
+    name with NumPy lookups. Missing values (None, NaN) score 0.
+    """
+    import numpy as np
+
+    names = [name if isinstance(name, str) else "" for name in names]
+    if not names:
+        empty = np.zeros(0, dtype=np.int64)
+        return {"expression": empty, "soul_urge": empty.copy(), "personality": empty.copy()}
+
+    tables = _name_tables()
+    # NUL separates the names and scores 0; any the names carry become _UNSCORED
+    text = "\0".join(names)
+    if text.count("\0") != len(names) - 1:
+        text = "\0".join(name.replace("\0", _UNSCORED) for name in names)
+    encoded = np.frombuffer(
+        codecs.charmap_encode(text, _FOLD_ERRORS, tables.encoding_table)[0], dtype=np.uint8
+    )
+    values = np.take(np.frombuffer(tables.values, dtype=np.uint8), encoded)
+    vowel_values = np.take(np.frombuffer(tables.vowel_values, dtype=np.uint8), encoded)
+    if _THANTHAKHAT in text:
+        silent = _silent_positions(np.take(np.frombuffer(tables.classes, dtype=np.uint8), encoded))
+        values[silent] = 0
+        vowel_values[silent] = 0
+
+    stops = np.append(np.flatnonzero(encoded == 0), len(encoded))
+    total = _segment_sums(values, stops)
+    vowels = _segment_sums(vowel_values, stops)
+    return {
+        "expression": reduce_number(total),
+        "soul_urge": reduce_number(vowels),
+        "personality": reduce_number(total - vowels),
+    }
@@ -0,0 +1,262 @@
+"""
+Prediction Store Module
+Prebuilt, memory-mapped table of prediction template positions for every birth date and period
+
+Build the store once (for example during image build), and again whenever
+PREDICTION_TEMPLATES gains or loses templates:
+    python -m core.prediction_store build
+    python -m core.prediction_store verify
+    python -m core.prediction_store rebuild
+
+PredictionGenerator.load_prediction_store() then answers each prediction with
+one indexed read. Template positions are language-neutral, so one record per
+(birth date, period) serves th, en and zh alike.
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import zlib
+
+from .predictors import (
+    DEFAULT_SEED_VERSION,
+    PERMUTATION_TABLES,
+    PREDICTION_CATEGORIES,
+    PREDICTION_PERIODS,
+    PREDICTION_TEMPLATES,
+    SEED_VERSIONS,
+    PredictionGenerator,
+)
+from .profile_index import DEFAULT_END, DEFAULT_START
+
+
+# ============== File Layout ==============
+# Header: magic, format version, seed version, first date ordinal, day count,
+# record size, CRC32 of the records and the template fingerprint
+MAGIC = b"HPST"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHBIIHI16s")
+# Per category, the rank of its picks in PERMUTATION_TABLES[(population, 3)]
+RECORD = struct.Struct(f"<{len(PREDICTION_CATEGORIES)}B")
+NUM_PREDICTIONS = 3
+
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "prediction_store.bin"
+)
+
+
+def _template_counts() -> Dict[str, List[int]]:
+    """Template count per category for each language"""
+    return {
+        lang: [len(templates[category]) for category in PREDICTION_CATEGORIES]
+        for lang, templates in PREDICTION_TEMPLATES.items()
+    }
+
+
+def template_fingerprint(seed_version: int) -> bytes:
+    """Digest of everything a stored position depends on
+
+    Template text is not included: positions stay valid when a template is
+    reworded, and only change when categories, periods, template counts or the
+    seed version do.
+    """
+    layout = {
+        "categories": PREDICTION_CATEGORIES,
+        "periods": PREDICTION_PERIODS,
+        "template_counts": _template_counts(),
+        "num_predictions": NUM_PREDICTIONS,
+        "seed_version": seed_version,
+    }
+    return hashlib.md5(json.dumps(layout, sort_keys=True).encode()).digest()
+
+
+def build_prediction_store(
+    path: str = DEFAULT_STORE_PATH,
+    start: date = DEFAULT_START,
+    end: date = DEFAULT_END,
+    seed_version: int = DEFAULT_SEED_VERSION,
+) -> int:
+    """Write template positions for every (date, period) in [start, end] and return the record count"""
+    import numpy as np
+
+    counts = _template_counts()
+    if len({tuple(c) for c in counts.values()}) != 1:
+        raise ValueError(f"template counts differ between languages, so positions are not language-neutral: {counts}")
+
+    dates = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    generator = PredictionGenerator(seed_version=seed_version)
+    # Positions are below 8, so base-8 digits identify each permutation
+    weights = np.array([8 ** (NUM_PREDICTIONS - 1 - i) for i in range(NUM_PREDICTIONS)])
+    rank_of = {}
+    for category in PREDICTION_CATEGORIES:
+        table = PERMUTATION_TABLES.get((len(generator.templates[category]), NUM_PREDICTIONS))
+        if table is None:
+            raise ValueError(f"{category} has more templates than a one-byte record can rank")
+        rank_of[category] = np.zeros(8 ** NUM_PREDICTIONS, dtype=np.uint8)
+        rank_of[category][np.array(table) @ weights] = np.arange(len(table))
+
+    records = np.zeros((len(dates), len(PREDICTION_PERIODS), RECORD.size), dtype=np.uint8)
+    for period_code, period in enumerate(PREDICTION_PERIODS):
+        batch = generator.generate_batch(dates, period, num_predictions=NUM_PREDICTIONS)
+        for code, category in enumerate(PREDICTION_CATEGORIES):
+            records[:, period_code, code] = rank_of[category][batch[category] @ weights]
+    payload = records.tobytes()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, seed_version, start.toordinal(), len(dates), RECORD.size,
+            zlib.crc32(payload), template_fingerprint(seed_version),
+        ))
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return len(dates) * len(PREDICTION_PERIODS)
+
+
+class PredictionStore:
+    """Read-only, memory-mapped view over a file written by build_prediction_store"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is too short to be a prediction store")
+        (magic, version, self.seed_version, self.start_ordinal, self.days, record_size,
+         self.checksum, self.fingerprint) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} prediction store")
+        # A truncated or padded file would otherwise fail inside lookup()
+        expected = HEADER.size + self.days * len(PREDICTION_PERIODS) * RECORD.size
+        if len(self._mmap) != expected:
+            size = len(self._mmap)
+            self._mmap.close()
+            raise ValueError(f"{path} holds {size} bytes, expected {expected}")
+        # Only meaningful while is_current(); a stale store is never looked up
+        self._tables = [
+            PERMUTATION_TABLES.get((len(PREDICTION_TEMPLATES["en"][category]), NUM_PREDICTIONS))
+            for category in PREDICTION_CATEGORIES
+        ]
+        self._periods = {period: code for code, period in enumerate(PREDICTION_PERIODS)}
+
+    def __len__(self) -> int:
+        return self.days * len(PREDICTION_PERIODS)
+
+    @property
+    def start(self) -> date:
+        return date.fromordinal(self.start_ordinal)
+
+    @property
+    def end(self) -> date:
+        return date.fromordinal(self.start_ordinal + self.days - 1)
+
+    def is_current(self) -> bool:
+        """Whether the store was built for the current templates and its seed version"""
+        return self.fingerprint == template_fingerprint(self.seed_version)
+
+    def lookup(self, birth_date: date, period: str) -> Optional[Dict[str, List[int]]]:
+        """Template positions per category, or None when the date or period is not stored"""
+        offset = birth_date.toordinal() - self.start_ordinal
+        period_code = self._periods.get(period)
+        if period_code is None or not 0 <= offset < self.days:
+            return None
+        ranks = RECORD.unpack_from(
+            self._mmap, HEADER.size + (offset * len(PREDICTION_PERIODS) + period_code) * RECORD.size
+        )
+        return {
+            category: list(table[rank])
+            for category, table, rank in zip(PREDICTION_CATEGORIES, self._tables, ranks)
+        }
+
+    def verify(self, sample: int = 1000) -> List[str]:
+        """Problems found in the store; an empty list means it is sound
+
+        Checks the checksum and template fingerprint, then recomputes ``sample``
+        random records and compares them with what is stored.
+        """
+        problems = []
+        payload = self._mmap[HEADER.size:]
+        if len(payload) != len(self) * RECORD.size:
+            problems.append(f"expected {len(self) * RECORD.size} bytes of records, found {len(payload)}")
+        elif zlib.crc32(payload) != self.checksum:
+            problems.append("checksum mismatch: the file is corrupt")
+        if not self.is_current():
+            problems.append("templates changed since the store was built; rebuild it")
+        if problems:
+            return problems
+
+        generator = PredictionGenerator(seed_version=self.seed_version)
+        rng = random.Random(0)
+        for _ in range(sample):
+            birth_date = date.fromordinal(self.start_ordinal + rng.randrange(self.days))
+            period = rng.choice(PREDICTION_PERIODS)
+            expected = {
+                category: generator._get_template_indices(category, birth_date, period, NUM_PREDICTIONS)
+                for category in PREDICTION_CATEGORIES
+            }
+            if self.lookup(birth_date, period) != expected:
+                problems.append(f"{birth_date} {period}: stored positions differ from computed ones")
+        return problems
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; verify returns 1 when the store has problems"""
+    parser = argparse.ArgumentParser(description="Build, verify or rebuild the prediction store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="write the store file")
+    build.add_argument("--start", default=DEFAULT_START.isoformat(), help="first date (YYYY-MM-DD)")
+    build.add_argument("--end", default=DEFAULT_END.isoformat(), help="last date (YYYY-MM-DD)")
+    build.add_argument("--seed-version", type=int, choices=SEED_VERSIONS, default=DEFAULT_SEED_VERSION)
+    verify = subparsers.add_parser("verify", help="check the checksum, templates and a sample of records")
+    verify.add_argument("--sample", type=int, default=1000)
+    subparsers.add_parser("rebuild", help="rebuild with the existing store's date range and seed version")
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("--path", default=DEFAULT_STORE_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == "verify":
+        try:
+            store = PredictionStore(args.path)
+        except ValueError as e:
+            print(f"FAIL: {e}")
+            return 1
+        problems = store.verify(args.sample)
+        store.close()
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        if not problems:
+            print(f"OK: {len(store)} records, {store.start} to {store.end}, seed version {store.seed_version}")
+        return 1 if problems else 0
+
+    if args.command == "rebuild":
+        store = PredictionStore(args.path)
+        start, end, seed_version = store.start, store.end, store.seed_version
+        store.close()
+    else:
+        start = datetime.strptime(args.start, "%Y-%m-%d").date()
+        end = datetime.strptime(args.end, "%Y-%m-%d").date()
+        seed_version = args.seed_version
+
+    count = build_prediction_store(args.path, start, end, seed_version)
+    size = os.path.getsize(args.path)
+    print(f"Wrote {count} records ({size / 1024:.0f} KiB) to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
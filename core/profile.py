@@ -0,0 +1,123 @@
+"""
+Compact Profile Module
+Slot-based astrological profile holding integer codes instead of nested dicts
+"""
+
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from .calculators import (
+    AstrologicalCalculator,
+    CHINESE_ELEMENTS,
+    CHINESE_ZODIAC_ANIMALS,
+    MOON_SIGNS,
+    NUMEROLOGY_TRAITS,
+    PROFILE_CODE_FIELDS,
+    VEDIC_SIGNS,
+    WESTERN_SIGNS,
+)
+
+
+class AstroProfile:
+    """Date-invariant profile stored as small integer codes
+
+    Names are resolved through the module tables only when a property or
+    to_dict() asks for them, so millions of profiles stay cheap to keep warm.
+    """
+
+    __slots__ = ("year", "month", "day") + PROFILE_CODE_FIELDS
+
+    def __init__(self, year: int, month: int, day: int, codes: Tuple[int, ...]):
+        self.year = year
+        self.month = month
+        self.day = day
+        for field, code in zip(PROFILE_CODE_FIELDS, codes):
+            setattr(self, field, code)
+
+    @classmethod
+    def from_date(cls, birth_date: date) -> "AstroProfile":
+        """Build a profile for a birth date"""
+        year, month, day = birth_date.year, birth_date.month, birth_date.day
+        return cls(year, month, day, AstrologicalCalculator.get_profile_codes(year, month, day))
+
+    @property
+    def codes(self) -> Tuple[int, ...]:
+        """Integer codes ordered as PROFILE_CODE_FIELDS"""
+        return tuple(getattr(self, field) for field in PROFILE_CODE_FIELDS)
+
+    @property
+    def birth_date(self) -> datetime:
+        return datetime(self.year, self.month, self.day)
+
+    @property
+    def western_zodiac(self) -> Tuple[str, str]:
+        return WESTERN_SIGNS[self.western_sign]
+
+    @property
+    def chinese_zodiac(self) -> Tuple[str, str, str, str]:
+        return CHINESE_ZODIAC_ANIMALS[self.chinese_animal] + CHINESE_ELEMENTS[self.chinese_element]
+
+    @property
+    def moon(self) -> Tuple[str, str]:
+        return MOON_SIGNS[self.moon_sign]
+
+    @property
+    def vedic_zodiac(self) -> Tuple[str, str, str]:
+        return VEDIC_SIGNS[self.vedic_sign]
+
+    @property
+    def buddhist_era(self) -> int:
+        return AstrologicalCalculator.get_buddhist_era(self.year)
+
+    def to_dict(self, as_of: Optional[datetime] = None) -> Dict:
+        """Expand to the nested dict returned by AstrologicalCalculator.calculate_all"""
+        animal_en, animal_th, element_en, element_th = self.chinese_zodiac
+        western_en, western_th = self.western_zodiac
+        moon_en, moon_th = self.moon
+        vedic_en, vedic_th, vedic_western = self.vedic_zodiac
+        overlay = AstrologicalCalculator.calculate_overlay(self.birth_date, as_of)
+
+        return {
+            "birth_date": f"{self.year:04d}-{self.month:02d}-{self.day:02d}",
+            "age": overlay["age"],
+            "chinese_zodiac": {
+                "animal_en": animal_en,
+                "animal_th": animal_th,
+                "element_en": element_en,
+                "element_th": element_th,
+            },
+            "western_zodiac": {
+                "sign_en": western_en,
+                "sign_th": western_th,
+            },
+            "moon_sign": {
+                "sign_en": moon_en,
+                "sign_th": moon_th,
+            },
+            "vedic_zodiac": {
+                "sign_en": vedic_en,
+                "sign_th": vedic_th,
+                "western_equivalent": vedic_western,
+            },
+            "numerology": {
+                "life_path": self.life_path,
+                "life_path_traits": NUMEROLOGY_TRAITS[self.life_path],
+                "karma_number": self.karma_number,
+                "soul_urge": self.soul_urge,
+                "personality": self.personality,
+                "penta_number": str(self.penta_number),
+            },
+            "biorhythm": overlay["biorhythm"],
+            "buddhist_era": self.buddhist_era,
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AstroProfile):
+            return NotImplemented
+        return (self.year, self.month, self.day) == (other.year, other.month, other.day)
+
+    def __hash__(self) -> int:
+        return hash((self.year, self.month, self.day))
+
+    def __repr__(self) -> str:
+        return f"AstroProfile({self.year:04d}-{self.month:02d}-{self.day:02d}, {self.western_zodiac[0]})"
@@ -0,0 +1,132 @@
+"""
+Profile Index Module
+Prebuilt, memory-mapped table of date-invariant profile codes for every birth date
+
+Build the index once (for example during image build):
+    python -m core.profile_index build
+
+Every worker that calls AstrologicalCalculator.load_profile_index() then maps
+the same file, so all processes share one page-cache copy.
+"""
+
+from datetime import date, datetime
+from typing import Optional, Tuple, TYPE_CHECKING
+import argparse
+import mmap
+import os
+import struct
+
+from .calculators import AstrologicalCalculator, PROFILE_CODE_FIELDS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# ============== File Layout ==============
+# Header: magic, format version, first date ordinal, record count, record size
+MAGIC = b"HPIX"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHIIH")
+# One unsigned byte per PROFILE_CODE_FIELDS entry; every code is below 256
+RECORD = struct.Struct(f"<{len(PROFILE_CODE_FIELDS)}B")
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "profile_index.bin"
+)
+DEFAULT_START = date(1900, 1, 1)
+# Past "today" on purpose so a deployed index never goes stale for new birth dates
+DEFAULT_END = date(2100, 12, 31)
+
+
+def build_profile_index(
+    path: str = DEFAULT_INDEX_PATH,
+    start: date = DEFAULT_START,
+    end: date = DEFAULT_END,
+) -> int:
+    """Write profile codes for every date in [start, end] and return the record count"""
+    import numpy as np
+
+    dates = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    columns = AstrologicalCalculator.calculate_batch(dates)
+    records = np.column_stack([columns[field] for field in PROFILE_CODE_FIELDS]).astype(np.uint8)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, start.toordinal(), len(records), RECORD.size))
+        f.write(records.tobytes())
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class ProfileIndex:
+    """Read-only, memory-mapped view over a file written by build_profile_index"""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is too short to be a profile index")
+        magic, version, self.start_ordinal, self.count, record_size = \
+            HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} profile index")
+        # A truncated or padded file would otherwise fail inside lookup()
+        expected = HEADER.size + self.count * RECORD.size
+        if len(self._mmap) != expected:
+            size = len(self._mmap)
+            self._mmap.close()
+            raise ValueError(f"{path} holds {size} bytes, expected {expected}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def offset(self, year: int, month: int, day: int) -> int:
+        """Day offset of a birth date from the first record"""
+        return date(year, month, day).toordinal() - self.start_ordinal
+
+    def lookup(self, year: int, month: int, day: int) -> Optional[Tuple[int, ...]]:
+        """Profile codes for a birth date, or None when it is outside the index"""
+        offset = self.offset(year, month, day)
+        if not 0 <= offset < self.count:
+            return None
+        return RECORD.unpack_from(self._mmap, HEADER.size + offset * RECORD.size)
+
+    @property
+    def records(self) -> "np.ndarray":
+        """Zero-copy (count, len(PROFILE_CODE_FIELDS)) uint8 view of all records"""
+        import numpy as np
+
+        return np.frombuffer(
+            self._mmap, dtype=np.uint8, count=self.count * RECORD.size, offset=HEADER.size
+        ).reshape(self.count, RECORD.size)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def main(argv=None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Build the memory-mapped profile index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="write the index file")
+    build.add_argument("--output", default=DEFAULT_INDEX_PATH)
+    build.add_argument("--start", default=DEFAULT_START.isoformat(), help="first date (YYYY-MM-DD)")
+    build.add_argument("--end", default=DEFAULT_END.isoformat(), help="last date (YYYY-MM-DD)")
+
+    args = parser.parse_args(argv)
+    start = datetime.strptime(args.start, "%Y-%m-%d").date()
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+
+    count = build_profile_index(args.output, start, end)
+    size = os.path.getsize(args.output)
+    print(f"Wrote {count} records ({size / 1024:.0f} KiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
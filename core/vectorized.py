@@ -0,0 +1,95 @@
+"""
+Vectorized Calculations Module
+NumPy implementations behind AstrologicalCalculator's batch and range APIs
+
+Kept separate from calculators.py so NumPy is only imported once a batch
+API is actually used.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+from . import lunar, numerology
+from .calculators import (
+    BIORHYTHM_CYCLES,
+    BIORHYTHM_PHASES,
+    MOON_SIGN_BY_DAY,
+    VEDIC_SIGN_BY_DAY,
+    WESTERN_SIGN_BY_DAY,
+    _MONTH_OFFSETS,
+)
+
+
+# ============== Lookup Arrays ==============
+_MONTH_OFFSETS_ARRAY = np.array(_MONTH_OFFSETS)
+_WESTERN_SIGN_BY_DAY_ARRAY = np.array(WESTERN_SIGN_BY_DAY)
+_MOON_SIGN_BY_DAY_ARRAY = np.array(MOON_SIGN_BY_DAY)
+_VEDIC_SIGN_BY_DAY_ARRAY = np.array(VEDIC_SIGN_BY_DAY)
+_BIORHYTHM_PHASE_ARRAYS = {name: np.array(phases) for name, phases in BIORHYTHM_PHASES.items()}
+
+
+def to_day_array(birth_dates) -> np.ndarray:
+    """Coerce a datetime64 array, pandas Series or sequence of dates to datetime64[D]
+    
+    Raises ValueError for missing dates (NaT or None), which have no profile.
+    """
+    dates = np.asarray(birth_dates, dtype="datetime64[D]")
+    missing = np.isnat(dates)
+    if missing.any():
+        raise ValueError(
+            f"birth_dates has {int(missing.sum())} missing value(s), the first at position "
+            f"{int(np.flatnonzero(missing.reshape(-1))[0])}; drop or fill them before batching"
+        )
+    return dates
+
+
+def calculate_batch(birth_dates, as_of: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+    """Columnar profile codes, numerology and biorhythm; see AstrologicalCalculator.calculate_batch"""
+    dates = to_day_array(birth_dates)
+    months_since_epoch = dates.astype("datetime64[M]")
+    year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months_since_epoch.astype(np.int64) % 12 + 1
+    day = (dates - months_since_epoch).astype(np.int64) + 1
+    
+    slot = _MONTH_OFFSETS_ARRAY[month - 1] + day - 1
+    moon_sign = lunar.moon_sign_array(dates)
+    moon_sign = np.where(moon_sign >= 0, moon_sign, _MOON_SIGN_BY_DAY_ARRAY[slot])
+    
+    karma = numerology.karma_number(day)
+    
+    today = np.datetime64((as_of or datetime.now()).date(), "D")
+    days = (today - dates).astype(np.int64)
+    
+    return {
+        "year": year,
+        "month": month,
+        "day": day,
+        "age": days // 365,
+        "western_sign": _WESTERN_SIGN_BY_DAY_ARRAY[slot],
+        "chinese_animal": (year - 4) % 12,
+        "chinese_element": (year - 4) % 10,
+        "moon_sign": moon_sign,
+        "vedic_sign": _VEDIC_SIGN_BY_DAY_ARRAY[slot],
+        "life_path": numerology.life_path_number(day, month, year),
+        "karma_number": karma,
+        "soul_urge": numerology.soul_urge_number(month, day),
+        "personality": karma.copy(),
+        "penta_number": numerology.penta_number(day),
+        "buddhist_era": year + 543,
+        "biorhythm_physical": _BIORHYTHM_PHASE_ARRAYS["physical"][days % 23],
+        "biorhythm_emotional": _BIORHYTHM_PHASE_ARRAYS["emotional"][days % 28],
+        "biorhythm_intellectual": _BIORHYTHM_PHASE_ARRAYS["intellectual"][days % 33],
+    }
+
+
+def biorhythm_range_batch(birth_dates, start: datetime, days: int) -> Dict[str, np.ndarray]:
+    """(n_birth_dates, days) curves per cycle; see AstrologicalCalculator.get_biorhythm_range_batch"""
+    window = np.datetime64(start, "D") + np.arange(days)
+    lived = (window[np.newaxis, :] - to_day_array(birth_dates).reshape(-1, 1)).astype(np.int64)
+    
+    result = {"dates": window}
+    for name, period in BIORHYTHM_CYCLES.items():
+        result[name] = _BIORHYTHM_PHASE_ARRAYS[name][lived % period]
+    return result
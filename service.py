@@ -0,0 +1,253 @@
+"""
+🔮 Horoscope Predictor - Headless JSON Service
+Serves the core engines over HTTP/1.1 without Streamlit, using only asyncio
+
+Usage:
+    python service.py --port 8080 --workers 4
+
+Endpoints (GET, JSON responses):
+    /profile?birth_date=1990-01-01
+    /prediction?birth_date=1990-01-01&period=daily|weekly|monthly&lang=th|en|zh
+    /lucky?birth_date=1990-01-01&lang=th|en|zh
+    /health
+
+Connections are kept alive between requests. Engine calls run on a bounded
+thread pool so slow requests cannot stall the event loop, and both idle
+connections and individual requests are subject to timeouts.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import asyncio
+import json
+
+from core import AstrologicalCalculator, PredictionGenerator
+from core.predictors import PREDICTION_PERIODS, PREDICTION_TEMPLATES
+
+
+# The endpoints never read a body, so anything larger is refused unread
+MAX_BODY_BYTES = 8192
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Content Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+class RequestError(Exception):
+    """Client error carrying the HTTP status to answer with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ============== Handlers ==============
+def _birth_date(params: Dict[str, str]) -> datetime:
+    try:
+        birth_date = datetime.strptime(params["birth_date"], "%Y-%m-%d")
+    except KeyError:
+        raise RequestError(400, "birth_date is required")
+    except ValueError:
+        raise RequestError(400, "birth_date must be YYYY-MM-DD")
+    if not datetime(1900, 1, 1) <= birth_date <= datetime.now():
+        raise RequestError(400, "birth_date must be between 1900-01-01 and today")
+    return birth_date
+
+
+def _lang(params: Dict[str, str]) -> str:
+    lang = params.get("lang", "th")
+    if lang not in PREDICTION_TEMPLATES:
+        raise RequestError(400, f"lang must be one of {', '.join(PREDICTION_TEMPLATES)}")
+    return lang
+
+
+def handle_profile(params: Dict[str, str]) -> Dict:
+    return AstrologicalCalculator.calculate_all(_birth_date(params))
+
+
+def handle_prediction(params: Dict[str, str]) -> Dict:
+    birth_date = _birth_date(params)
+    period = params.get("period", "daily")
+    if period not in PREDICTION_PERIODS:
+        raise RequestError(400, f"period must be one of {', '.join(PREDICTION_PERIODS)}")
+
+    data = AstrologicalCalculator.calculate_all(birth_date)
+    predictor = PredictionGenerator.for_language(_lang(params))
+    if period == "daily":
+        return predictor.generate_daily_prediction(data, birth_date)
+    if period == "weekly":
+        return predictor.generate_weekly_forecast(data, birth_date)
+    return predictor.generate_monthly_outlook(data, birth_date)
+
+
+def handle_lucky(params: Dict[str, str]) -> Dict:
+    data = AstrologicalCalculator.calculate_all(_birth_date(params))
+    return dict(PredictionGenerator.for_language(_lang(params)).get_lucky_elements(data))
+
+
+def handle_health(params: Dict[str, str]) -> Dict:
+    return {"status": "ok"}
+
+
+ROUTES: Dict[str, Callable[[Dict[str, str]], Dict]] = {
+    "/profile": handle_profile,
+    "/prediction": handle_prediction,
+    "/lucky": handle_lucky,
+    "/health": handle_health,
+}
+
+
+# ============== HTTP Server ==============
+class HoroscopeService:
+    """Minimal keep-alive HTTP/1.1 JSON server over asyncio streams"""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_pending: int = 256,
+        request_timeout: float = 5.0,
+        idle_timeout: float = 30.0,
+    ):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="horoscope")
+        # Requests beyond this are refused with 503 instead of queueing without bound
+        self.slots = asyncio.BoundedSemaphore(max_pending)
+        self.request_timeout = request_timeout
+        self.idle_timeout = idle_timeout
+
+    async def dispatch(self, method: str, target: str) -> Tuple[int, Dict]:
+        """Route one request to its handler on the worker pool"""
+        if method != "GET":
+            return 405, {"error": "only GET is supported"}
+
+        url = urlsplit(target)
+        handler = ROUTES.get(url.path)
+        if handler is None:
+            return 404, {"error": f"unknown endpoint {url.path}"}
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if self.slots.locked():
+            return 503, {"error": "server is at capacity"}
+        async with self.slots:
+            loop = asyncio.get_running_loop()
+            try:
+                body = await asyncio.wait_for(
+                    loop.run_in_executor(self.executor, handler, params),
+                    timeout=self.request_timeout,
+                )
+            except RequestError as e:
+                return e.status, {"error": str(e)}
+            except asyncio.TimeoutError:
+                return 504, {"error": "request timed out"}
+            except Exception as e:
+                return 500, {"error": f"{type(e).__name__}: {e}"}
+        return 200, body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it or goes idle"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=self.idle_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # Drain any request body; the endpoints only use the query string
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.respond(writer, 400, {"error": "invalid Content-Length"}, keep_alive=False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self.respond(
+                        writer, 413, {"error": f"request body exceeds {MAX_BODY_BYTES} bytes"}, keep_alive=False
+                    )
+                    break
+                if length:
+                    try:
+                        await asyncio.wait_for(reader.readexactly(length), timeout=self.idle_timeout)
+                    except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                        break
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                status, body = await self.dispatch(method, target)
+                await self.respond(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer: asyncio.StreamWriter, status: int, body: Dict, keep_alive: bool) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080, ready: Optional[asyncio.Event] = None) -> None:
+        AstrologicalCalculator.load_profile_index()
+        PredictionGenerator.load_prediction_store()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Serve horoscope results as JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4, help="threads for engine calls")
+    parser.add_argument("--max-pending", type=int, default=256, help="in-flight requests before 503")
+    parser.add_argument("--request-timeout", type=float, default=5.0, help="seconds per request")
+    parser.add_argument("--idle-timeout", type=float, default=30.0, help="seconds a keep-alive connection may idle")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        service = HoroscopeService(args.workers, args.max_pending, args.request_timeout, args.idle_timeout)
+        print(f"Serving on http://{args.host}:{args.port}")
+        await service.serve(args.host, args.port)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()